@@ -336,8 +336,12 @@ class american:
         dividend_yields: FloatOrArray,
         sigmas: FloatOrArray,
         is_calls: FloatOrArray,
+        out: NDArray[np.float64] | None = None,
     ) -> dict[str, NDArray[np.float64]]:
-        """Calculate batch of Greeks for American model."""
+        """Calculate batch of Greeks for American model, filling a C-contiguous (6, N) `out` array in place if given.
+
+        Rows are delta, gamma, vega, theta, rho and dividend_rho, which is always zero.
+        """
         ...
 
     @staticmethod
@@ -354,8 +358,9 @@ class american:
         rates: FloatOrArray,
         dividend_yields: FloatOrArray,
         is_calls: FloatOrArray,
+        initial_guesses: FloatOrArray | None = None,
     ) -> NDArray[np.float64]:
-        """Calculate batch of implied volatilities."""
+        """Calculate batch of implied volatilities, seeding Newton per option unless initial_guesses is given."""
         ...
 
 # Module version
@@ -5,16 +5,20 @@
 
 use arrow::array::Float64Array;
 use arrow::error::ArrowError;
-use numpy::{PyArray1, PyArrayMethods};
+use numpy::{PyArray1, PyArray2, PyArrayMethods, PyUntypedArrayMethods};
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 use pyo3::types::{PyDict, PyList};
 use pyo3_arrow::error::PyArrowResult;
+use quantforge_core::compute::american::BoundaryCache;
 use quantforge_core::compute::formulas::{
     black76_call_scalar, black76_put_scalar, black_scholes_call_scalar, black_scholes_put_scalar,
     merton_call_scalar, merton_put_scalar,
 };
-use quantforge_core::compute::{Black76, BlackScholes, Merton};
+use quantforge_core::compute::{
+    fill_broadcast_rows, map_broadcast, map_broadcast_with, Black76, BlackScholes, Merton,
+};
+use quantforge_core::constants::GREEK_VOL_CHANGE;
 
 use crate::arrow_common::{
     create_greeks_dict, extract_black76_arrays, extract_black_scholes_arrays,
@@ -56,6 +60,16 @@ fn extract_as_vec(value: &Bound<'_, PyAny>) -> PyResult<Vec<f64>> {
     ))
 }
 
+/// Broadcast-aware element access for `extract_as_vec` outputs (length-1 inputs act as scalars)
+#[inline(always)]
+fn broadcast_value(values: &[f64], i: usize) -> f64 {
+    if values.len() == 1 {
+        values[0]
+    } else {
+        values[i]
+    }
+}
+
 /// Black-Scholes call price calculation using Arrow arrays
 ///
 /// Parameters:
@@ -642,38 +656,15 @@ pub fn american_greeks(
         )));
     }
 
-    let delta = if is_call {
-        quantforge_core::compute::american::american_call_delta(s, k, t, r, q, sigma)
-    } else {
-        quantforge_core::compute::american::american_put_delta(s, k, t, r, q, sigma)
-    };
-
-    let gamma = quantforge_core::compute::american::american_call_gamma(s, k, t, r, q, sigma);
-
-    let vega = if is_call {
-        quantforge_core::compute::american::american_call_vega(s, k, t, r, q, sigma)
-    } else {
-        quantforge_core::compute::american::american_put_vega(s, k, t, r, q, sigma)
-    };
-
-    let theta = if is_call {
-        quantforge_core::compute::american::american_call_theta(s, k, t, r, q, sigma)
-    } else {
-        quantforge_core::compute::american::american_put_theta(s, k, t, r, q, sigma)
-    };
-
-    let rho = if is_call {
-        quantforge_core::compute::american::american_call_rho(s, k, t, r, q, sigma)
-    } else {
-        quantforge_core::compute::american::american_put_rho(s, k, t, r, q, sigma)
-    };
+    let greeks =
+        quantforge_core::compute::american::american_greeks_scalar(s, k, t, r, q, sigma, is_call);
 
     let greeks_dict = PyDict::new(py);
-    greeks_dict.set_item("delta", delta)?;
-    greeks_dict.set_item("gamma", gamma)?;
-    greeks_dict.set_item("vega", vega)?;
-    greeks_dict.set_item("theta", theta)?;
-    greeks_dict.set_item("rho", rho)?;
+    greeks_dict.set_item("delta", greeks.delta)?;
+    greeks_dict.set_item("gamma", greeks.gamma)?;
+    greeks_dict.set_item("vega", greeks.vega)?;
+    greeks_dict.set_item("theta", greeks.theta)?;
+    greeks_dict.set_item("rho", greeks.rho)?;
     greeks_dict.set_item("dividend_rho", 0.0)?; // Not implemented yet
 
     Ok(greeks_dict.into())
@@ -727,8 +718,8 @@ pub fn american_implied_volatility(
         // Newton-Raphson update
         sigma -= diff / (vega * 100.0); // vega is per 1% change
 
-        // Keep sigma in reasonable bounds
-        sigma = sigma.clamp(0.001, 5.0);
+        // Keep sigma in reasonable bounds; the floor keeps vega's sigma - h bump valid
+        sigma = sigma.clamp(GREEK_VOL_CHANGE + 0.001, 5.0);
     }
 
     Err(PyValueError::new_err("Failed to converge"))
@@ -767,43 +758,20 @@ pub fn american_call_price_batch(
     .max()
     .unwrap();
 
-    let mut results = Vec::with_capacity(len);
-
-    for i in 0..len {
-        let s = if spots_vec.len() == 1 {
-            spots_vec[0]
-        } else {
-            spots_vec[i]
-        };
-        let k = if strikes_vec.len() == 1 {
-            strikes_vec[0]
-        } else {
-            strikes_vec[i]
-        };
-        let t = if times_vec.len() == 1 {
-            times_vec[0]
-        } else {
-            times_vec[i]
-        };
-        let r = if rates_vec.len() == 1 {
-            rates_vec[0]
-        } else {
-            rates_vec[i]
-        };
-        let q = if divs_vec.len() == 1 {
-            divs_vec[0]
-        } else {
-            divs_vec[i]
-        };
-        let sigma = if sigmas_vec.len() == 1 {
-            sigmas_vec[0]
-        } else {
-            sigmas_vec[i]
-        };
-
-        let price = quantforge_core::compute::american::american_call_scalar(s, k, t, r, q, sigma);
-        results.push(price);
-    }
+    // Release GIL for computation
+    let results = py.allow_threads(|| {
+        map_broadcast_with(len, BoundaryCache::default, |cache, i| {
+            quantforge_core::compute::american::american_call_scalar_cached(
+                broadcast_value(&spots_vec, i),
+                broadcast_value(&strikes_vec, i),
+                broadcast_value(&times_vec, i),
+                broadcast_value(&rates_vec, i),
+                broadcast_value(&divs_vec, i),
+                broadcast_value(&sigmas_vec, i),
+                cache,
+            )
+        })
+    });
 
     // Return as numpy array
     use numpy::ToPyArray;
@@ -843,43 +811,20 @@ pub fn american_put_price_batch(
     .max()
     .unwrap();
 
-    let mut results = Vec::with_capacity(len);
-
-    for i in 0..len {
-        let s = if spots_vec.len() == 1 {
-            spots_vec[0]
-        } else {
-            spots_vec[i]
-        };
-        let k = if strikes_vec.len() == 1 {
-            strikes_vec[0]
-        } else {
-            strikes_vec[i]
-        };
-        let t = if times_vec.len() == 1 {
-            times_vec[0]
-        } else {
-            times_vec[i]
-        };
-        let r = if rates_vec.len() == 1 {
-            rates_vec[0]
-        } else {
-            rates_vec[i]
-        };
-        let q = if divs_vec.len() == 1 {
-            divs_vec[0]
-        } else {
-            divs_vec[i]
-        };
-        let sigma = if sigmas_vec.len() == 1 {
-            sigmas_vec[0]
-        } else {
-            sigmas_vec[i]
-        };
-
-        let price = quantforge_core::compute::american::american_put_scalar(s, k, t, r, q, sigma);
-        results.push(price);
-    }
+    // Release GIL for computation
+    let results = py.allow_threads(|| {
+        map_broadcast_with(len, BoundaryCache::default, |cache, i| {
+            quantforge_core::compute::american::american_put_scalar_cached(
+                broadcast_value(&spots_vec, i),
+                broadcast_value(&strikes_vec, i),
+                broadcast_value(&times_vec, i),
+                broadcast_value(&rates_vec, i),
+                broadcast_value(&divs_vec, i),
+                broadcast_value(&sigmas_vec, i),
+                cache,
+            )
+        })
+    });
 
     // Return as numpy array
     use numpy::ToPyArray;
@@ -889,17 +834,18 @@ pub fn american_put_price_batch(
 /// American option Greeks batch processing
 #[pyfunction]
 #[pyo3(name = "greeks_batch")]
-#[pyo3(signature = (spots, strikes, times, rates, dividend_yields, sigmas, is_calls=true))]
+#[pyo3(signature = (spots, strikes, times, rates, dividend_yields, sigmas, is_calls=true, out=None))]
 #[allow(clippy::too_many_arguments)]
-pub fn american_greeks_batch(
-    py: Python,
-    spots: &Bound<'_, PyAny>,
-    strikes: &Bound<'_, PyAny>,
-    times: &Bound<'_, PyAny>,
-    rates: &Bound<'_, PyAny>,
-    dividend_yields: &Bound<'_, PyAny>,
-    sigmas: &Bound<'_, PyAny>,
+pub fn american_greeks_batch<'py>(
+    py: Python<'py>,
+    spots: &Bound<'py, PyAny>,
+    strikes: &Bound<'py, PyAny>,
+    times: &Bound<'py, PyAny>,
+    rates: &Bound<'py, PyAny>,
+    dividend_yields: &Bound<'py, PyAny>,
+    sigmas: &Bound<'py, PyAny>,
     is_calls: bool, // Changed from is_call to is_calls for consistency
+    out: Option<Bound<'py, PyArray2<f64>>>,
 ) -> PyResult<PyObject> {
     // Handle scalar or array inputs
     let s_array = extract_as_vec(spots)?;
@@ -922,86 +868,71 @@ pub fn american_greeks_batch(
     .max()
     .unwrap();
 
-    let mut delta_vec = Vec::with_capacity(len);
-    let mut gamma_vec = Vec::with_capacity(len);
-    let mut vega_vec = Vec::with_capacity(len);
-    let mut theta_vec = Vec::with_capacity(len);
-    let mut rho_vec = Vec::with_capacity(len);
-
-    for i in 0..len {
-        let s = if s_array.len() == 1 {
-            s_array[0]
-        } else {
-            s_array[i]
-        };
-        let k = if k_array.len() == 1 {
-            k_array[0]
-        } else {
-            k_array[i]
-        };
-        let t = if t_array.len() == 1 {
-            t_array[0]
-        } else {
-            t_array[i]
-        };
-        let r = if r_array.len() == 1 {
-            r_array[0]
-        } else {
-            r_array[i]
-        };
-        let q = if q_array.len() == 1 {
-            q_array[0]
-        } else {
-            q_array[i]
-        };
-        let sigma = if sigma_array.len() == 1 {
-            sigma_array[0]
-        } else {
-            sigma_array[i]
-        };
-
-        let delta = if is_calls {
-            quantforge_core::compute::american::american_call_delta(s, k, t, r, q, sigma)
-        } else {
-            quantforge_core::compute::american::american_put_delta(s, k, t, r, q, sigma)
-        };
-
-        let gamma = quantforge_core::compute::american::american_call_gamma(s, k, t, r, q, sigma);
-
-        let vega = if is_calls {
-            quantforge_core::compute::american::american_call_vega(s, k, t, r, q, sigma)
-        } else {
-            quantforge_core::compute::american::american_put_vega(s, k, t, r, q, sigma)
-        };
-
-        let theta = if is_calls {
-            quantforge_core::compute::american::american_call_theta(s, k, t, r, q, sigma)
-        } else {
-            quantforge_core::compute::american::american_put_theta(s, k, t, r, q, sigma)
-        };
-
-        let rho = if is_calls {
-            quantforge_core::compute::american::american_call_rho(s, k, t, r, q, sigma)
-        } else {
-            quantforge_core::compute::american::american_put_rho(s, k, t, r, q, sigma)
-        };
-
-        delta_vec.push(delta);
-        gamma_vec.push(gamma);
-        vega_vec.push(vega);
-        theta_vec.push(theta);
-        rho_vec.push(rho);
-    }
-
-    // Create output dictionary with numpy arrays
-    use numpy::ToPyArray;
+    // One (6, len) float64 buffer; each Greek is returned as a contiguous row view of it.
+    // dividend_rho is not modelled for American options and its row is always zero.
+    // A caller-supplied `out` buffer is used instead of a new one so repeated calls
+    // allocate nothing; the rows are indexed as a flat C-order slice, so it must be
+    // C-contiguous.
+    let greek_names = ["delta", "gamma", "vega", "theta", "rho", "dividend_rho"];
+    let greeks_array = match out {
+        Some(out) => {
+            if out.shape() != [greek_names.len(), len] {
+                return Err(PyValueError::new_err(format!(
+                    "out must have shape ({}, {len}) (got {:?})",
+                    greek_names.len(),
+                    out.shape()
+                )));
+            }
+            if !out.is_c_contiguous() {
+                return Err(PyValueError::new_err("out must be C-contiguous"));
+            }
+            out
+        }
+        // SAFETY: every element is written below before the array is exposed to Python
+        None => unsafe { PyArray2::<f64>::new(py, [greek_names.len(), len], false) },
+    };
+    let mut guard = greeks_array
+        .try_readwrite()
+        .map_err(|err| PyValueError::new_err(format!("out must be writeable ({err})")))?;
+    let buffer = guard.as_slice_mut()?;
+
+    // One mutable slice per Greek row; the kernel writes each option straight into them
+    let (delta, rest) = buffer.split_at_mut(len);
+    let (gamma, rest) = rest.split_at_mut(len);
+    let (vega, rest) = rest.split_at_mut(len);
+    let (theta, rest) = rest.split_at_mut(len);
+    let (rho, dividend_rho) = rest.split_at_mut(len);
+
+    // Release GIL for computation; all Greeks of an option come from one fused pass
+    py.allow_threads(|| {
+        fill_broadcast_rows([delta, gamma, vega, theta, rho, dividend_rho], |i| {
+            let s = broadcast_value(&s_array, i);
+            let k = broadcast_value(&k_array, i);
+            let t = broadcast_value(&t_array, i);
+            let r = broadcast_value(&r_array, i);
+            let q = broadcast_value(&q_array, i);
+            let sigma = broadcast_value(&sigma_array, i);
+
+            let greeks = quantforge_core::compute::american::american_greeks_scalar(
+                s, k, t, r, q, sigma, is_calls,
+            );
+            [
+                greeks.delta,
+                greeks.gamma,
+                greeks.vega,
+                greeks.theta,
+                greeks.rho,
+                0.0,
+            ]
+        });
+    });
+    drop(guard);
+
+    // Create output dictionary with numpy row views
     let greeks_dict = PyDict::new(py);
-    greeks_dict.set_item("delta", delta_vec.to_pyarray(py))?;
-    greeks_dict.set_item("gamma", gamma_vec.to_pyarray(py))?;
-    greeks_dict.set_item("vega", vega_vec.to_pyarray(py))?;
-    greeks_dict.set_item("theta", theta_vec.to_pyarray(py))?;
-    greeks_dict.set_item("rho", rho_vec.to_pyarray(py))?;
-    greeks_dict.set_item("dividend_rho", vec![0.0; len].to_pyarray(py))?;
+    for (row, name) in greek_names.iter().enumerate() {
+        greeks_dict.set_item(name, greeks_array.get_item(row)?)?;
+    }
 
     Ok(greeks_dict.into())
 }
@@ -1081,15 +1012,17 @@ pub fn american_exercise_boundary_batch(
         .downcast_ref::<Float64Array>()
         .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyTypeError, _>("sigmas must be numeric"))?;
 
-    // Calculate exercise boundaries
-    let result = American::exercise_boundary(
-        strikes_f64,
-        times_f64,
-        rates_f64,
-        dividend_yields_f64,
-        sigmas_f64,
-        is_calls,
-    )?;
+    // Calculate exercise boundaries (release GIL for computation)
+    let result = py.allow_threads(|| {
+        American::exercise_boundary(
+            strikes_f64,
+            times_f64,
+            rates_f64,
+            dividend_yields_f64,
+            sigmas_f64,
+            is_calls,
+        )
+    })?;
 
     // Convert result to arro3
     use arrow::datatypes::{DataType, Field};
@@ -1105,7 +1038,7 @@ pub fn american_exercise_boundary_batch(
 /// American option implied volatility batch processing
 #[pyfunction]
 #[pyo3(name = "implied_volatility_batch")]
-#[pyo3(signature = (prices, spots, strikes, times, rates, dividend_yields, is_calls=true))]
+#[pyo3(signature = (prices, spots, strikes, times, rates, dividend_yields, is_calls=true, initial_guesses=None))]
 #[allow(clippy::too_many_arguments)]
 pub fn american_implied_volatility_batch(
     py: Python,
@@ -1116,6 +1049,7 @@ pub fn american_implied_volatility_batch(
     rates: &Bound<'_, PyAny>,
     dividend_yields: &Bound<'_, PyAny>,
     is_calls: bool, // Changed to is_calls for consistency
+    initial_guesses: Option<&Bound<'_, PyAny>>,
 ) -> PyResult<PyObject> {
     // Handle scalar or array inputs
     let price_array = extract_as_vec(prices)?;
@@ -1124,6 +1058,7 @@ pub fn american_implied_volatility_batch(
     let t_array = extract_as_vec(times)?;
     let r_array = extract_as_vec(rates)?;
     let q_array = extract_as_vec(dividend_yields)?;
+    let guess_array = initial_guesses.map(extract_as_vec).transpose()?;
 
     // Determine output length (max of all input lengths)
     let len = *[
@@ -1137,70 +1072,66 @@ pub fn american_implied_volatility_batch(
     .iter()
     .max()
     .unwrap();
+    if let Some(guesses) = &guess_array {
+        if guesses.len() != 1 && guesses.len() != len {
+            return Err(PyValueError::new_err(format!(
+                "initial_guesses must be a scalar or have length {len} (got {})",
+                guesses.len()
+            )));
+        }
+        // The Newton clamp only applies after the first pricing call, so a bad
+        // guess would otherwise reach the pricer unchecked
+        if let Some(bad) = guesses.iter().find(|g| !g.is_finite() || **g <= 0.0) {
+            return Err(PyValueError::new_err(format!(
+                "initial_guesses must be finite and positive (got {bad})"
+            )));
+        }
+    }
 
-    let mut results = Vec::with_capacity(len);
-
-    for i in 0..len {
-        let price = if price_array.len() == 1 {
-            price_array[0]
-        } else {
-            price_array[i]
-        };
-        let s = if s_array.len() == 1 {
-            s_array[0]
-        } else {
-            s_array[i]
-        };
-        let k = if k_array.len() == 1 {
-            k_array[0]
-        } else {
-            k_array[i]
-        };
-        let t = if t_array.len() == 1 {
-            t_array[0]
-        } else {
-            t_array[i]
-        };
-        let r = if r_array.len() == 1 {
-            r_array[0]
-        } else {
-            r_array[i]
-        };
-        let q = if q_array.len() == 1 {
-            q_array[0]
-        } else {
-            q_array[i]
-        };
-
-        // Simple Newton-Raphson implied volatility
-        let mut sigma = 0.2; // Initial guess
-        let mut converged = false;
-
-        for _ in 0..100 {
-            let calc_price = if is_calls {
-                quantforge_core::compute::american::american_call_scalar(s, k, t, r, q, sigma)
-            } else {
-                quantforge_core::compute::american::american_put_scalar(s, k, t, r, q, sigma)
-            };
-
-            let vega = if is_calls {
-                quantforge_core::compute::american::american_call_vega(s, k, t, r, q, sigma)
-            } else {
-                quantforge_core::compute::american::american_put_vega(s, k, t, r, q, sigma)
+    // Release GIL for computation
+    let results = py.allow_threads(|| {
+        map_broadcast(len, |i| {
+            let price = broadcast_value(&price_array, i);
+            let s = broadcast_value(&s_array, i);
+            let k = broadcast_value(&k_array, i);
+            let t = broadcast_value(&t_array, i);
+            let r = broadcast_value(&r_array, i);
+            let q = broadcast_value(&q_array, i);
+
+            // Newton-Raphson from the caller's guess (e.g. a previous solve of the same
+            // surface) or a per-option Manaster-Koehler seed
+            let mut sigma = match &guess_array {
+                Some(guesses) => broadcast_value(guesses, i),
+                None => {
+                    quantforge_core::compute::american::american_iv_initial_guess(s, k, t, r, q)
+                }
             };
 
-            let diff = calc_price - price;
-            if diff.abs() < 1e-6 {
-                converged = true;
-                break;
+            for _ in 0..100 {
+                let calc_price = if is_calls {
+                    quantforge_core::compute::american::american_call_scalar(s, k, t, r, q, sigma)
+                } else {
+                    quantforge_core::compute::american::american_put_scalar(s, k, t, r, q, sigma)
+                };
+
+                let vega = if is_calls {
+                    quantforge_core::compute::american::american_call_vega(s, k, t, r, q, sigma)
+                } else {
+                    quantforge_core::compute::american::american_put_vega(s, k, t, r, q, sigma)
+                };
+
+                let diff = calc_price - price;
+                if diff.abs() < 1e-6 {
+                    return sigma;
+                }
+
+                sigma -= diff / (vega * 100.0);
+                sigma = sigma.clamp(GREEK_VOL_CHANGE + 0.001, 5.0);
             }
 
-            sigma -= diff / (vega * 100.0);
-            sigma = sigma.clamp(0.001, 5.0);
-        }
-
-        results.push(if converged { sigma } else { f64::NAN });
-    }
+            f64::NAN
+        })
+    });
 
     // Return as numpy array
     use numpy::ToPyArray;
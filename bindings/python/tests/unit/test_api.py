@@ -5,25 +5,28 @@ import quantforge
 
 models = quantforge
 
+# Shared ATM scalar arguments (s/f, k, t, r, sigma), passed positionally
+ATM_ARGS = (100.0, 100.0, 1.0, 0.05, 0.2)
+
 
 class TestBlackScholesAPI:
     """Test Black-Scholes Python API."""
 
     def test_call_price_scalar(self):
         """Test scalar call price calculation."""
-        price = models.black_scholes.call_price(100, 100, 1, 0.05, 0.2)
+        price = models.black_scholes.call_price(*ATM_ARGS)
         assert isinstance(price, float)
         assert abs(price - 10.450583572185565) < 1e-10
 
     def test_put_price_scalar(self):
         """Test scalar put price calculation."""
-        price = models.black_scholes.put_price(100, 100, 1, 0.05, 0.2)
+        price = models.black_scholes.put_price(*ATM_ARGS)
         assert isinstance(price, float)
         assert price > 0
 
     def test_greeks_return_type(self):
         """Test Greeks return dictionary."""
-        greeks = models.black_scholes.greeks(100, 100, 1, 0.05, 0.2)
+        greeks = models.black_scholes.greeks(*ATM_ARGS)
         assert isinstance(greeks, dict)
         assert all(k in greeks for k in ["delta", "gamma", "vega", "theta", "rho"])
 
@@ -54,7 +57,7 @@ class TestBlack76API:
 
     def test_call_price_scalar(self):
         """Test scalar call price calculation."""
-        price = models.black76.call_price(100, 100, 1, 0.05, 0.2)
+        price = models.black76.call_price(*ATM_ARGS)
         assert isinstance(price, float)
         assert price > 0
 
@@ -79,7 +82,7 @@ class TestMertonAPI:
 
     def test_zero_dividend_equals_black_scholes(self):
         """Test that Merton with q=0 equals Black-Scholes."""
-        bs_price = models.black_scholes.call_price(100, 100, 1, 0.05, 0.2)
+        bs_price = models.black_scholes.call_price(*ATM_ARGS)
         merton_price = models.merton.call_price(100, 100, 1, 0.05, 0.0, 0.2)
 
         assert abs(bs_price - merton_price) < 1e-10
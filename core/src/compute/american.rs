@@ -6,23 +6,25 @@
 //!    - Dampening factor of 0.695 calibrated to match BENCHOP
 //! 2. Cox-Ross-Rubinstein binomial tree - optional high-precision method
 
-use arrow::array::builder::Float64Builder;
 use arrow::array::{ArrayRef, Float64Array};
 use arrow::error::ArrowError;
 use std::sync::Arc;
 
 // Main implementation: BAW with dampening
+pub use super::american_simple::BoundaryCache;
 use super::american_simple::{
-    american_call_simple, american_put_simple, calculate_critical_price_call,
+    american_call_simple_cached, american_put_simple_cached, calculate_critical_price_call,
     calculate_critical_price_put,
 };
 // Adaptive implementation for experimental use
 pub(crate) use super::american_adaptive::{american_call_adaptive, american_put_adaptive};
 use super::formulas::black_scholes_call_scalar;
-use super::{get_scalar_or_array_value, validate_broadcast_compatibility};
+use super::{
+    get_scalar_or_array_value, map_broadcast, map_broadcast_with, validate_broadcast_compatibility,
+};
 use crate::constants::{
-    get_parallel_threshold, BASIS_POINT_MULTIPLIER, DAYS_PER_YEAR, GREEK_PRICE_CHANGE_RATIO,
-    GREEK_RATE_CHANGE, GREEK_VOL_CHANGE, TIME_NEAR_EXPIRY_THRESHOLD,
+    BASIS_POINT_MULTIPLIER, DAYS_PER_YEAR, GREEK_PRICE_CHANGE_RATIO, GREEK_RATE_CHANGE,
+    GREEK_VOL_CHANGE, TIME_NEAR_EXPIRY_THRESHOLD,
 };
 
 // ============================================================================
@@ -32,6 +34,19 @@ use crate::constants::{
 /// Barone-Adesi-Whaley American call option price with empirical dampening
 #[inline(always)]
 pub fn american_call_scalar(s: f64, k: f64, t: f64, r: f64, q: f64, sigma: f64) -> f64 {
+    american_call_scalar_cached(s, k, t, r, q, sigma, &mut BoundaryCache::default())
+}
+
+/// `american_call_scalar` reusing the BAW boundary in `cache` when (k, t, r, q, sigma) match
+pub fn american_call_scalar_cached(
+    s: f64,
+    k: f64,
+    t: f64,
+    r: f64,
+    q: f64,
+    sigma: f64,
+    cache: &mut BoundaryCache,
+) -> f64 {
     // Validation
     if s <= 0.0 || k <= 0.0 || t < 0.0 || sigma < 0.0 {
         panic!("Invalid parameters: s, k must be positive; t, sigma must be non-negative");
@@ -56,12 +71,41 @@ pub fn american_call_scalar(s: f64, k: f64, t: f64, r: f64, q: f64, sigma: f64)
     }
 
     // Use BAW approximation with empirical dampening
-    american_call_simple(s, k, t, r, q, sigma)
+    american_call_simple_cached(s, k, t, r, q, sigma, cache)
+}
+
+/// American call prices for several spots sharing one (k, t, r, q, sigma) point
+///
+/// Same result as calling `american_call_scalar` per spot, but the BAW boundary
+/// is solved once for all spots.
+pub fn american_call_spots<const N: usize>(
+    spots: [f64; N],
+    k: f64,
+    t: f64,
+    r: f64,
+    q: f64,
+    sigma: f64,
+) -> [f64; N] {
+    let mut cache = BoundaryCache::default();
+    spots.map(|s| american_call_scalar_cached(s, k, t, r, q, sigma, &mut cache))
 }
 
 /// Barone-Adesi-Whaley American put option price with empirical dampening
 #[inline(always)]
 pub fn american_put_scalar(s: f64, k: f64, t: f64, r: f64, q: f64, sigma: f64) -> f64 {
+    american_put_scalar_cached(s, k, t, r, q, sigma, &mut BoundaryCache::default())
+}
+
+/// `american_put_scalar` reusing the BAW boundary in `cache` when (k, t, r, q, sigma) match
+pub fn american_put_scalar_cached(
+    s: f64,
+    k: f64,
+    t: f64,
+    r: f64,
+    q: f64,
+    sigma: f64,
+    cache: &mut BoundaryCache,
+) -> f64 {
     // Validation
     if s <= 0.0 || k <= 0.0 || t < 0.0 || sigma < 0.0 {
         panic!("Invalid parameters: s, k must be positive; t, sigma must be non-negative");
@@ -73,7 +117,23 @@ pub fn american_put_scalar(s: f64, k: f64, t: f64, r: f64, q: f64, sigma: f64) -
     }
 
     // Use BAW approximation with empirical dampening
-    american_put_simple(s, k, t, r, q, sigma)
+    american_put_simple_cached(s, k, t, r, q, sigma, cache)
+}
+
+/// American put prices for several spots sharing one (k, t, r, q, sigma) point
+///
+/// Same result as calling `american_put_scalar` per spot, but the BAW boundary
+/// is solved once for all spots.
+pub fn american_put_spots<const N: usize>(
+    spots: [f64; N],
+    k: f64,
+    t: f64,
+    r: f64,
+    q: f64,
+    sigma: f64,
+) -> [f64; N] {
+    let mut cache = BoundaryCache::default();
+    spots.map(|s| american_put_scalar_cached(s, k, t, r, q, sigma, &mut cache))
 }
 
 /// Adaptive BAW American call option price (experimental)
@@ -141,30 +201,50 @@ pub fn american_binomial(
     let p = (((r - q) * dt).exp() - d) / (u - d);
     let discount = (-r * dt).exp();
 
-    // Memory-efficient implementation: use single array
-    let mut values = vec![0.0; n_steps + 1];
-
-    // Calculate terminal payoffs
-    for (i, value) in values.iter_mut().enumerate() {
-        let spot_t = s * u.powi(i as i32) * d.powi((n_steps - i) as i32);
-        *value = if is_call {
-            (spot_t - k).max(0.0)
-        } else {
-            (k - spot_t).max(0.0)
-        };
+    // Discounted branch probabilities, hoisted out of the backward sweep
+    let p_up = discount * p;
+    let p_down = discount * (1.0 - p);
+
+    // Node spot at (step, i) is s * u^i * d^(step - i) = s * u^(2i - step) since d = 1/u.
+    // Tabulate s * u^j for j in -n_steps..=n_steps once instead of two powi calls per node,
+    // growing outward from s by one multiply per entry so the table itself needs no powi.
+    let mut spot_table = vec![s; 2 * n_steps + 1];
+    for j in 1..=n_steps {
+        spot_table[n_steps + j] = spot_table[n_steps + j - 1] * u;
+        spot_table[n_steps - j] = spot_table[n_steps - j + 1] * d;
     }
 
-    // Backward induction
+    // Payoff is max(sign * (spot - k), 0); folding call/put into a sign keeps the
+    // branch out of the inner loop.
+    let sign = if is_call { 1.0 } else { -1.0 };
+
+    // Nodes of one step are every other table entry, starting at offset n_steps - step.
+    // Splitting the table by parity makes each step's spots a contiguous slice.
+    let even_spots: Vec<f64> = spot_table.iter().step_by(2).copied().collect();
+    let odd_spots: Vec<f64> = spot_table.iter().skip(1).step_by(2).copied().collect();
+
+    // Memory-efficient implementation: only the current time slice is kept.
+    // Terminal nodes (step = n_steps, offset 0) are the even entries.
+    let mut values: Vec<f64> = even_spots
+        .iter()
+        .map(|&spot| (sign * (spot - k)).max(0.0))
+        .collect();
+
+    // Backward induction; hold and exercise values are combined with a branchless max,
+    // and contiguous slices let the sweep vectorize
     for step in (0..n_steps).rev() {
-        for i in 0..=step {
-            let spot = s * u.powi(i as i32) * d.powi((step - i) as i32);
-            let hold_value = discount * (p * values[i + 1] + (1.0 - p) * values[i]);
-            let exercise_value = if is_call {
-                (spot - k).max(0.0)
-            } else {
-                (k - spot).max(0.0)
-            };
-            values[i] = hold_value.max(exercise_value);
+        let offset = n_steps - step;
+        let parity_spots = if offset % 2 == 0 {
+            &even_spots
+        } else {
+            &odd_spots
+        };
+        let spots = &parity_spots[offset / 2..=offset / 2 + step];
+        let slice = &mut values[..spots.len() + 1];
+        for i in 0..spots.len() {
+            let hold_value = p_up * slice[i + 1] + p_down * slice[i];
+            let exercise_value = (sign * (spots[i] - k)).max(0.0);
+            slice[i] = hold_value.max(exercise_value);
         }
     }
 
@@ -179,8 +259,7 @@ pub fn american_binomial(
 #[inline(always)]
 pub fn american_call_delta(s: f64, k: f64, t: f64, r: f64, q: f64, sigma: f64) -> f64 {
     let h = GREEK_PRICE_CHANGE_RATIO * s;
-    let price_up = american_call_scalar(s + h, k, t, r, q, sigma);
-    let price_down = american_call_scalar(s - h, k, t, r, q, sigma);
+    let [price_up, price_down] = american_call_spots([s + h, s - h], k, t, r, q, sigma);
     (price_up - price_down) / (2.0 * h)
 }
 
@@ -188,8 +267,7 @@ pub fn american_call_delta(s: f64, k: f64, t: f64, r: f64, q: f64, sigma: f64) -
 #[inline(always)]
 pub fn american_put_delta(s: f64, k: f64, t: f64, r: f64, q: f64, sigma: f64) -> f64 {
     let h = GREEK_PRICE_CHANGE_RATIO * s;
-    let price_up = american_put_scalar(s + h, k, t, r, q, sigma);
-    let price_down = american_put_scalar(s - h, k, t, r, q, sigma);
+    let [price_up, price_down] = american_put_spots([s + h, s - h], k, t, r, q, sigma);
     (price_up - price_down) / (2.0 * h)
 }
 
@@ -197,9 +275,8 @@ pub fn american_put_delta(s: f64, k: f64, t: f64, r: f64, q: f64, sigma: f64) ->
 #[inline(always)]
 pub fn american_call_gamma(s: f64, k: f64, t: f64, r: f64, q: f64, sigma: f64) -> f64 {
     let h = GREEK_PRICE_CHANGE_RATIO * s;
-    let price_up = american_call_scalar(s + h, k, t, r, q, sigma);
-    let price_center = american_call_scalar(s, k, t, r, q, sigma);
-    let price_down = american_call_scalar(s - h, k, t, r, q, sigma);
+    let [price_up, price_center, price_down] =
+        american_call_spots([s + h, s, s - h], k, t, r, q, sigma);
     (price_up - 2.0 * price_center + price_down) / (h * h)
 }
 
@@ -271,6 +348,99 @@ pub fn american_put_rho(s: f64, k: f64, t: f64, r: f64, q: f64, sigma: f64) -> f
     (price_up - price_down) / (2.0 * h) / BASIS_POINT_MULTIPLIER
 }
 
+/// American option Greeks from one finite-difference pass
+#[derive(Debug, Clone, Copy, PartialEq)]
+pub struct AmericanGreeks {
+    pub delta: f64,
+    pub gamma: f64,
+    pub vega: f64,
+    pub theta: f64,
+    pub rho: f64,
+}
+
+/// Calculate all American Greeks in one pass
+///
+/// Matches the individual `american_{call,put}_{delta,gamma,vega,theta,rho}` functions,
+/// but prices the spot bumps against a single BAW boundary solve and reuses the
+/// unbumped price for gamma and theta instead of repricing it per Greek.
+///
+/// A call takes 8 price evaluations and 6 boundary solves. A put also prices the
+/// call spot ladder, because its gamma is the call gamma (see `american_put_gamma`),
+/// so it takes 11 evaluations and 7 solves.
+pub fn american_greeks_scalar(
+    s: f64,
+    k: f64,
+    t: f64,
+    r: f64,
+    q: f64,
+    sigma: f64,
+    is_call: bool,
+) -> AmericanGreeks {
+    let price_fn = if is_call {
+        american_call_scalar
+    } else {
+        american_put_scalar
+    };
+
+    // Spot bumps (delta, gamma) share one boundary solve
+    let h = GREEK_PRICE_CHANGE_RATIO * s;
+    let spots = [s + h, s, s - h];
+    let call_prices = american_call_spots(spots, k, t, r, q, sigma);
+    let [price_up, price, price_down] = if is_call {
+        call_prices
+    } else {
+        american_put_spots(spots, k, t, r, q, sigma)
+    };
+
+    let delta = (price_up - price_down) / (2.0 * h);
+    // Gamma is taken from call prices for both option types (see american_put_gamma)
+    let gamma = (call_prices[0] - 2.0 * call_prices[1] + call_prices[2]) / (h * h);
+
+    let vega = (price_fn(s, k, t, r, q, sigma + GREEK_VOL_CHANGE)
+        - price_fn(s, k, t, r, q, sigma - GREEK_VOL_CHANGE))
+        / (2.0 * GREEK_VOL_CHANGE)
+        / BASIS_POINT_MULTIPLIER;
+
+    let theta_h = 1.0 / DAYS_PER_YEAR;
+    let theta = if t <= theta_h {
+        0.0 // Can't calculate theta near expiry
+    } else {
+        (price_fn(s, k, t - theta_h, r, q, sigma) - price) / theta_h
+    };
+
+    let rho = (price_fn(s, k, t, r + GREEK_RATE_CHANGE, q, sigma)
+        - price_fn(s, k, t, r - GREEK_RATE_CHANGE, q, sigma))
+        / (2.0 * GREEK_RATE_CHANGE)
+        / BASIS_POINT_MULTIPLIER;
+
+    AmericanGreeks {
+        delta,
+        gamma,
+        vega,
+        theta,
+        rho,
+    }
+}
+
+/// Starting volatility for an American implied volatility Newton solve
+///
+/// Manaster-Koehler seed `sqrt(2|ln(s/k) + (r - q)t| / t)`: the volatility at which
+/// the European price is most sensitive to sigma, so Newton converges without
+/// overshooting. Floored for near-ATM options where the formula tends to zero;
+/// falls back to 0.2 when `t <= 0` or the inputs make the formula non-finite.
+#[inline(always)]
+pub fn american_iv_initial_guess(s: f64, k: f64, t: f64, r: f64, q: f64) -> f64 {
+    if t <= 0.0 {
+        return 0.2;
+    }
+    let seed = (2.0 * ((s / k).ln() + (r - q) * t).abs() / t).sqrt();
+    if seed.is_finite() {
+        seed.clamp(0.1, 5.0)
+    } else {
+        0.2
+    }
+}
+
 // ============================================================================
 // EXERCISE BOUNDARY CALCULATION
 // ============================================================================
@@ -312,6 +482,28 @@ pub fn exercise_boundary_scalar(k: f64, t: f64, r: f64, q: f64, sigma: f64, is_c
 // ARROW NATIVE IMPLEMENTATION
 // ============================================================================
 
+/// Evaluate `f(s, k, t, r, q, sigma)` over broadcast Arrow inputs via `map_broadcast`
+fn map_broadcast_inputs<F>(inputs: [&Float64Array; 6], f: F) -> Result<ArrayRef, ArrowError>
+where
+    F: Fn(f64, f64, f64, f64, f64, f64) -> f64 + Sync + Send,
+{
+    let [spots, strikes, times, rates, dividend_yields, sigmas] = inputs;
+    let len = validate_broadcast_compatibility(&inputs)?;
+
+    let results = map_broadcast(len, |i| {
+        f(
+            get_scalar_or_array_value(spots, i),
+            get_scalar_or_array_value(strikes, i),
+            get_scalar_or_array_value(times, i),
+            get_scalar_or_array_value(rates, i),
+            get_scalar_or_array_value(dividend_yields, i),
+            get_scalar_or_array_value(sigmas, i),
+        )
+    });
+
+    Ok(Arc::new(Float64Array::from(results)))
+}
+
 /// American option model implementation using Arrow arrays
 pub struct American;
 
@@ -335,48 +527,19 @@ impl American {
             sigmas,
         ])?;
 
-        // Handle empty arrays
-        if len == 0 {
-            return Ok(Arc::new(Float64Builder::new().finish()));
-        }
-
-        let mut builder = Float64Builder::with_capacity(len);
-
-        if len >= get_parallel_threshold() {
-            // Parallel processing for large arrays
-            use rayon::prelude::*;
-
-            let results: Vec<f64> = (0..len)
-                .into_par_iter()
-                .map(|i| {
-                    let s = get_scalar_or_array_value(spots, i);
-                    let k = get_scalar_or_array_value(strikes, i);
-                    let t = get_scalar_or_array_value(times, i);
-                    let r = get_scalar_or_array_value(rates, i);
-                    let q = get_scalar_or_array_value(dividend_yields, i);
-                    let sigma = get_scalar_or_array_value(sigmas, i);
-
-                    american_call_scalar(s, k, t, r, q, sigma)
-                })
-                .collect();
+        // Each rayon split (or the sequential pass) keeps its own boundary cache
+        let results = map_broadcast_with(len, BoundaryCache::default, |cache, i| {
+            let s = get_scalar_or_array_value(spots, i);
+            let k = get_scalar_or_array_value(strikes, i);
+            let t = get_scalar_or_array_value(times, i);
+            let r = get_scalar_or_array_value(rates, i);
+            let q = get_scalar_or_array_value(dividend_yields, i);
+            let sigma = get_scalar_or_array_value(sigmas, i);
 
-            builder.append_slice(&results);
-        } else {
-            // Sequential processing for small arrays
-            for i in 0..len {
-                let s = get_scalar_or_array_value(spots, i);
-                let k = get_scalar_or_array_value(strikes, i);
-                let t = get_scalar_or_array_value(times, i);
-                let r = get_scalar_or_array_value(rates, i);
-                let q = get_scalar_or_array_value(dividend_yields, i);
-                let sigma = get_scalar_or_array_value(sigmas, i);
-
-                let price = american_call_scalar(s, k, t, r, q, sigma);
-                builder.append_value(price);
-            }
-        }
+            american_call_scalar_cached(s, k, t, r, q, sigma, cache)
+        });
 
-        Ok(Arc::new(builder.finish()))
+        Ok(Arc::new(Float64Array::from(results)))
     }
 
     /// Calculate American put option price
@@ -398,48 +561,19 @@ impl American {
             sigmas,
         ])?;
 
-        // Handle empty arrays
-        if len == 0 {
-            return Ok(Arc::new(Float64Builder::new().finish()));
-        }
-
-        let mut builder = Float64Builder::with_capacity(len);
-
-        if len >= get_parallel_threshold() {
-            // Parallel processing for large arrays
-            use rayon::prelude::*;
-
-            let results: Vec<f64> = (0..len)
-                .into_par_iter()
-                .map(|i| {
-                    let s = get_scalar_or_array_value(spots, i);
-                    let k = get_scalar_or_array_value(strikes, i);
-                    let t = get_scalar_or_array_value(times, i);
-                    let r = get_scalar_or_array_value(rates, i);
-                    let q = get_scalar_or_array_value(dividend_yields, i);
-                    let sigma = get_scalar_or_array_value(sigmas, i);
-
-                    american_put_scalar(s, k, t, r, q, sigma)
-                })
-                .collect();
+        // Each rayon split (or the sequential pass) keeps its own boundary cache
+        let results = map_broadcast_with(len, BoundaryCache::default, |cache, i| {
+            let s = get_scalar_or_array_value(spots, i);
+            let k = get_scalar_or_array_value(strikes, i);
+            let t = get_scalar_or_array_value(times, i);
+            let r = get_scalar_or_array_value(rates, i);
+            let q = get_scalar_or_array_value(dividend_yields, i);
+            let sigma = get_scalar_or_array_value(sigmas, i);
 
-            builder.append_slice(&results);
-        } else {
-            // Sequential processing for small arrays
-            for i in 0..len {
-                let s = get_scalar_or_array_value(spots, i);
-                let k = get_scalar_or_array_value(strikes, i);
-                let t = get_scalar_or_array_value(times, i);
-                let r = get_scalar_or_array_value(rates, i);
-                let q = get_scalar_or_array_value(dividend_yields, i);
-                let sigma = get_scalar_or_array_value(sigmas, i);
-
-                let price = american_put_scalar(s, k, t, r, q, sigma);
-                builder.append_value(price);
-            }
-        }
+            american_put_scalar_cached(s, k, t, r, q, sigma, cache)
+        });
 
-        Ok(Arc::new(builder.finish()))
+        Ok(Arc::new(Float64Array::from(results)))
     }
 
     /// Calculate Delta for American options
@@ -452,38 +586,16 @@ impl American {
         sigmas: &Float64Array,
         is_call: bool,
     ) -> Result<ArrayRef, ArrowError> {
-        let len = validate_broadcast_compatibility(&[
-            spots,
-            strikes,
-            times,
-            rates,
-            dividend_yields,
-            sigmas,
-        ])?;
-
-        if len == 0 {
-            return Ok(Arc::new(Float64Builder::new().finish()));
-        }
-
-        let mut builder = Float64Builder::with_capacity(len);
-
-        for i in 0..len {
-            let s = get_scalar_or_array_value(spots, i);
-            let k = get_scalar_or_array_value(strikes, i);
-            let t = get_scalar_or_array_value(times, i);
-            let r = get_scalar_or_array_value(rates, i);
-            let q = get_scalar_or_array_value(dividend_yields, i);
-            let sigma = get_scalar_or_array_value(sigmas, i);
-
-            let delta = if is_call {
-                american_call_delta(s, k, t, r, q, sigma)
-            } else {
-                american_put_delta(s, k, t, r, q, sigma)
-            };
-            builder.append_value(delta);
-        }
-
-        Ok(Arc::new(builder.finish()))
+        map_broadcast_inputs(
+            [spots, strikes, times, rates, dividend_yields, sigmas],
+            |s, k, t, r, q, sigma| {
+                if is_call {
+                    american_call_delta(s, k, t, r, q, sigma)
+                } else {
+                    american_put_delta(s, k, t, r, q, sigma)
+                }
+            },
+        )
     }
 
     /// Calculate Gamma for American options
@@ -495,34 +607,11 @@ impl American {
         dividend_yields: &Float64Array,
         sigmas: &Float64Array,
     ) -> Result<ArrayRef, ArrowError> {
-        let len = validate_broadcast_compatibility(&[
-            spots,
-            strikes,
-            times,
-            rates,
-            dividend_yields,
-            sigmas,
-        ])?;
-
-        if len == 0 {
-            return Ok(Arc::new(Float64Builder::new().finish()));
-        }
-
-        let mut builder = Float64Builder::with_capacity(len);
-
-        for i in 0..len {
-            let s = get_scalar_or_array_value(spots, i);
-            let k = get_scalar_or_array_value(strikes, i);
-            let t = get_scalar_or_array_value(times, i);
-            let r = get_scalar_or_array_value(rates, i);
-            let q = get_scalar_or_array_value(dividend_yields, i);
-            let sigma = get_scalar_or_array_value(sigmas, i);
-
-            let gamma = american_call_gamma(s, k, t, r, q, sigma);
-            builder.append_value(gamma);
-        }
-
-        Ok(Arc::new(builder.finish()))
+        // Gamma is the same for calls and puts
+        map_broadcast_inputs(
+            [spots, strikes, times, rates, dividend_yields, sigmas],
+            american_call_gamma,
+        )
     }
 
     /// Calculate Vega for American options
@@ -535,38 +624,16 @@ impl American {
         sigmas: &Float64Array,
         is_call: bool,
     ) -> Result<ArrayRef, ArrowError> {
-        let len = validate_broadcast_compatibility(&[
-            spots,
-            strikes,
-            times,
-            rates,
-            dividend_yields,
-            sigmas,
-        ])?;
-
-        if len == 0 {
-            return Ok(Arc::new(Float64Builder::new().finish()));
-        }
-
-        let mut builder = Float64Builder::with_capacity(len);
-
-        for i in 0..len {
-            let s = get_scalar_or_array_value(spots, i);
-            let k = get_scalar_or_array_value(strikes, i);
-            let t = get_scalar_or_array_value(times, i);
-            let r = get_scalar_or_array_value(rates, i);
-            let q = get_scalar_or_array_value(dividend_yields, i);
-            let sigma = get_scalar_or_array_value(sigmas, i);
-
-            let vega = if is_call {
-                american_call_vega(s, k, t, r, q, sigma)
-            } else {
-                american_put_vega(s, k, t, r, q, sigma)
-            };
-            builder.append_value(vega);
-        }
-
-        Ok(Arc::new(builder.finish()))
+        map_broadcast_inputs(
+            [spots, strikes, times, rates, dividend_yields, sigmas],
+            |s, k, t, r, q, sigma| {
+                if is_call {
+                    american_call_vega(s, k, t, r, q, sigma)
+                } else {
+                    american_put_vega(s, k, t, r, q, sigma)
+                }
+            },
+        )
     }
 
     /// Calculate Theta for American options
@@ -579,38 +646,16 @@ impl American {
         sigmas: &Float64Array,
         is_call: bool,
     ) -> Result<ArrayRef, ArrowError> {
-        let len = validate_broadcast_compatibility(&[
-            spots,
-            strikes,
-            times,
-            rates,
-            dividend_yields,
-            sigmas,
-        ])?;
-
-        if len == 0 {
-            return Ok(Arc::new(Float64Builder::new().finish()));
-        }
-
-        let mut builder = Float64Builder::with_capacity(len);
-
-        for i in 0..len {
-            let s = get_scalar_or_array_value(spots, i);
-            let k = get_scalar_or_array_value(strikes, i);
-            let t = get_scalar_or_array_value(times, i);
-            let r = get_scalar_or_array_value(rates, i);
-            let q = get_scalar_or_array_value(dividend_yields, i);
-            let sigma = get_scalar_or_array_value(sigmas, i);
-
-            let theta = if is_call {
-                american_call_theta(s, k, t, r, q, sigma)
-            } else {
-                american_put_theta(s, k, t, r, q, sigma)
-            };
-            builder.append_value(theta);
-        }
-
-        Ok(Arc::new(builder.finish()))
+        map_broadcast_inputs(
+            [spots, strikes, times, rates, dividend_yields, sigmas],
+            |s, k, t, r, q, sigma| {
+                if is_call {
+                    american_call_theta(s, k, t, r, q, sigma)
+                } else {
+                    american_put_theta(s, k, t, r, q, sigma)
+                }
+            },
+        )
     }
 
     /// Calculate Rho for American options
@@ -623,38 +668,16 @@ impl American {
         sigmas: &Float64Array,
         is_call: bool,
     ) -> Result<ArrayRef, ArrowError> {
-        let len = validate_broadcast_compatibility(&[
-            spots,
-            strikes,
-            times,
-            rates,
-            dividend_yields,
-            sigmas,
-        ])?;
-
-        if len == 0 {
-            return Ok(Arc::new(Float64Builder::new().finish()));
-        }
-
-        let mut builder = Float64Builder::with_capacity(len);
-
-        for i in 0..len {
-            let s = get_scalar_or_array_value(spots, i);
-            let k = get_scalar_or_array_value(strikes, i);
-            let t = get_scalar_or_array_value(times, i);
-            let r = get_scalar_or_array_value(rates, i);
-            let q = get_scalar_or_array_value(dividend_yields, i);
-            let sigma = get_scalar_or_array_value(sigmas, i);
-
-            let rho = if is_call {
-                american_call_rho(s, k, t, r, q, sigma)
-            } else {
-                american_put_rho(s, k, t, r, q, sigma)
-            };
-            builder.append_value(rho);
-        }
-
-        Ok(Arc::new(builder.finish()))
+        map_broadcast_inputs(
+            [spots, strikes, times, rates, dividend_yields, sigmas],
+            |s, k, t, r, q, sigma| {
+                if is_call {
+                    american_call_rho(s, k, t, r, q, sigma)
+                } else {
+                    american_put_rho(s, k, t, r, q, sigma)
+                }
+            },
+        )
     }
 
     /// Calculate exercise boundary for American options
@@ -670,46 +693,17 @@ impl American {
         let len =
             validate_broadcast_compatibility(&[strikes, times, rates, dividend_yields, sigmas])?;
 
-        // Handle empty arrays
-        if len == 0 {
-            return Ok(Arc::new(Float64Builder::new().finish()));
-        }
-
-        let mut builder = Float64Builder::with_capacity(len);
-
-        if len >= get_parallel_threshold() {
-            // Parallel processing for large arrays
-            use rayon::prelude::*;
-
-            let results: Vec<f64> = (0..len)
-                .into_par_iter()
-                .map(|i| {
-                    let k = get_scalar_or_array_value(strikes, i);
-                    let t = get_scalar_or_array_value(times, i);
-                    let r = get_scalar_or_array_value(rates, i);
-                    let q = get_scalar_or_array_value(dividend_yields, i);
-                    let sigma = get_scalar_or_array_value(sigmas, i);
-
-                    exercise_boundary_scalar(k, t, r, q, sigma, is_call)
-                })
-                .collect();
+        let results = map_broadcast(len, |i| {
+            let k = get_scalar_or_array_value(strikes, i);
+            let t = get_scalar_or_array_value(times, i);
+            let r = get_scalar_or_array_value(rates, i);
+            let q = get_scalar_or_array_value(dividend_yields, i);
+            let sigma = get_scalar_or_array_value(sigmas, i);
 
-            builder.append_slice(&results);
-        } else {
-            // Sequential processing for small arrays
-            for i in 0..len {
-                let k = get_scalar_or_array_value(strikes, i);
-                let t = get_scalar_or_array_value(times, i);
-                let r = get_scalar_or_array_value(rates, i);
-                let q = get_scalar_or_array_value(dividend_yields, i);
-                let sigma = get_scalar_or_array_value(sigmas, i);
-
-                let boundary = exercise_boundary_scalar(k, t, r, q, sigma, is_call);
-                builder.append_value(boundary);
-            }
-        }
+            exercise_boundary_scalar(k, t, r, q, sigma, is_call)
+        });
 
-        Ok(Arc::new(builder.finish()))
+        Ok(Arc::new(Float64Array::from(results)))
     }
 }
 
@@ -785,6 +779,23 @@ mod tests {
         assert!(put_boundary > 0.0); // Put boundary should be positive
     }
 
+    #[test]
+    fn test_iv_initial_guess_degenerate_inputs() {
+        // t = 0 at the money is 0/0 and negative t takes a negative square root
+        assert_eq!(american_iv_initial_guess(100.0, 100.0, 0.0, 0.05, 0.0), 0.2);
+        assert_eq!(
+            american_iv_initial_guess(100.0, 100.0, -1.0, 0.05, 0.0),
+            0.2
+        );
+        assert_eq!(
+            american_iv_initial_guess(-100.0, 100.0, 1.0, 0.05, 0.0),
+            0.2
+        );
+
+        let seed = american_iv_initial_guess(120.0, 100.0, 1.0, TEST_RATE, TEST_DIVIDEND_YIELD);
+        assert!((0.1..=5.0).contains(&seed));
+    }
+
     #[test]
     fn test_exercise_boundary_batch() {
         use arrow::array::Float64Array;
@@ -6,8 +6,48 @@ use crate::constants::{BAW_DAMPENING_FACTOR, TIME_NEAR_EXPIRY_THRESHOLD};
 use crate::math::calculate_d1;
 use crate::math::distributions::norm_cdf;
 
+/// Spot-independent BAW quantities (critical price, A coefficient, exponent), memoized
+/// for the last (k, t, r, q, sigma) point they were solved at
+///
+/// Consecutive prices that share every parameter but spot (spot ladders, finite-difference
+/// bumps, broadcast batches) reuse the boundary solve. Keys compare exactly, so cached and
+/// uncached prices are bit-identical.
+#[derive(Debug, Clone, Copy, Default)]
+pub struct BoundaryCache {
+    key: Option<(bool, [f64; 5])>,
+    boundary: (f64, f64, f64),
+}
+
+impl BoundaryCache {
+    fn get_or_solve(
+        &mut self,
+        is_call: bool,
+        params: [f64; 5],
+        solve: impl FnOnce() -> (f64, f64, f64),
+    ) -> (f64, f64, f64) {
+        if self.key != Some((is_call, params)) {
+            self.boundary = solve();
+            self.key = Some((is_call, params));
+        }
+        self.boundary
+    }
+}
+
 /// Simplified BAW for testing - American call with dividends  
 pub fn american_call_simple(s: f64, k: f64, t: f64, r: f64, q: f64, sigma: f64) -> f64 {
+    american_call_simple_cached(s, k, t, r, q, sigma, &mut BoundaryCache::default())
+}
+
+/// `american_call_simple` reusing the boundary held in `cache` when its parameters match
+pub fn american_call_simple_cached(
+    s: f64,
+    k: f64,
+    t: f64,
+    r: f64,
+    q: f64,
+    sigma: f64,
+    cache: &mut BoundaryCache,
+) -> f64 {
     // Near expiry
     if t < TIME_NEAR_EXPIRY_THRESHOLD {
         return (s - k).max(0.0);
@@ -23,21 +63,40 @@ pub fn american_call_simple(s: f64, k: f64, t: f64, r: f64, q: f64, sigma: f64)
 
     // Barone-Adesi-Whaley approximation for early exercise premium
     // Always apply BAW approximation when there are dividends
-    let s_star = calculate_critical_price_call(k, t, r, q, sigma);
+    let (s_star, a2, q2) = cache.get_or_solve(true, [k, t, r, q, sigma], || {
+        let s_star = calculate_critical_price_call(k, t, r, q, sigma);
+        (
+            s_star,
+            calculate_a2_call(s_star, k, t, r, q, sigma),
+            calculate_q2(r, q, sigma),
+        )
+    });
     if s >= s_star {
         // Immediate exercise optimal
         return s - k;
     }
 
-    // Add early exercise premium
-    let a2 = calculate_a2_call(k, t, r, q, sigma);
-    let q2 = calculate_q2(r, q, sigma);
+    // Add early exercise premium; the approximate boundary can sit above the true one,
+    // so never let the approximation fall below the exercise value
     let premium = a2 * (s / s_star).powf(q2);
-    european_value + premium.max(0.0)
+    (european_value + premium.max(0.0)).max(s - k)
 }
 
 /// Simplified American put using Barone-Adesi-Whaley approximation
 pub fn american_put_simple(s: f64, k: f64, t: f64, r: f64, q: f64, sigma: f64) -> f64 {
+    american_put_simple_cached(s, k, t, r, q, sigma, &mut BoundaryCache::default())
+}
+
+/// `american_put_simple` reusing the boundary held in `cache` when its parameters match
+pub fn american_put_simple_cached(
+    s: f64,
+    k: f64,
+    t: f64,
+    r: f64,
+    q: f64,
+    sigma: f64,
+    cache: &mut BoundaryCache,
+) -> f64 {
     // Near expiry
     if t < TIME_NEAR_EXPIRY_THRESHOLD {
         return (k - s).max(0.0);
@@ -53,18 +112,24 @@ pub fn american_put_simple(s: f64, k: f64, t: f64, r: f64, q: f64, sigma: f64) -
     }
 
     // BAW approximation for early exercise premium
-    let s_star = calculate_critical_price_put(k, t, r, q, sigma);
+    let (s_star, a2, q1) = cache.get_or_solve(false, [k, t, r, q, sigma], || {
+        let s_star = calculate_critical_price_put(k, t, r, q, sigma);
+        (
+            s_star,
+            calculate_a2_put(s_star, k, t, r, q, sigma),
+            calculate_q1(r, q, sigma),
+        )
+    });
     if s <= s_star {
         // Immediate exercise optimal
         return k - s;
     }
 
     // Add early exercise premium with dampening to avoid overestimation
-    let a2 = calculate_a2_put(k, t, r, q, sigma);
-    let q1 = calculate_q1(r, q, sigma);
     // q1 is negative, so we use it directly to get decreasing premium as s increases
+    // Floor at the exercise value, which the dampened boundary can otherwise undercut
     let premium = BAW_DAMPENING_FACTOR * a2 * (s / s_star).powf(q1);
-    european_value + premium.max(0.0)
+    (european_value + premium.max(0.0)).max(k - s)
 }
 
 // Helper functions for BAW approximation
@@ -128,18 +193,16 @@ pub(super) fn calculate_critical_price_put(k: f64, t: f64, r: f64, q: f64, sigma
     s_inf * (1.0 + BAW_DAMPENING_FACTOR * h * (1.0 - (k / s_inf).powf(1.0 / m)))
 }
 
-/// Calculate A2 coefficient for call
-fn calculate_a2_call(k: f64, t: f64, r: f64, q: f64, sigma: f64) -> f64 {
-    let s_star = calculate_critical_price_call(k, t, r, q, sigma);
+/// Calculate A2 coefficient for call at its critical price `s_star`
+fn calculate_a2_call(s_star: f64, k: f64, t: f64, r: f64, q: f64, sigma: f64) -> f64 {
     let q2 = calculate_q2(r, q, sigma);
     let d1 = calculate_d1(s_star, k, t, r, q, sigma);
 
     (s_star / q2) * (1.0 - (-q * t).exp() * norm_cdf(d1))
 }
 
-/// Calculate A2 coefficient for put
-fn calculate_a2_put(k: f64, t: f64, r: f64, q: f64, sigma: f64) -> f64 {
-    let s_star = calculate_critical_price_put(k, t, r, q, sigma);
+/// Calculate A2 coefficient for put at its critical price `s_star`
+fn calculate_a2_put(s_star: f64, k: f64, t: f64, r: f64, q: f64, sigma: f64) -> f64 {
     let q1 = calculate_q1(r, q, sigma);
     let d1 = calculate_d1(s_star, k, t, r, q, sigma);
 
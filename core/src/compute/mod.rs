@@ -34,6 +34,74 @@ pub fn get_scalar_or_array_value(array: &Float64Array, index: usize) -> f64 {
     }
 }
 
+/// Evaluate `f` for each output index, in parallel once `len` reaches the parallel threshold
+pub fn map_broadcast<T, F>(len: usize, f: F) -> Vec<T>
+where
+    T: Send,
+    F: Fn(usize) -> T + Sync + Send,
+{
+    map_broadcast_with(len, || (), |_, i| f(i))
+}
+
+/// `map_broadcast` with per-worker scratch state from `init` (one per rayon split, or one
+/// for the whole sequential pass)
+pub fn map_broadcast_with<S, T, I, F>(len: usize, init: I, f: F) -> Vec<T>
+where
+    T: Send,
+    I: Fn() -> S + Sync + Send,
+    F: Fn(&mut S, usize) -> T + Sync + Send,
+{
+    if len >= crate::constants::get_parallel_threshold() {
+        use rayon::prelude::*;
+        (0..len).into_par_iter().map_init(init, f).collect()
+    } else {
+        let mut state = init();
+        (0..len).map(|i| f(&mut state, i)).collect()
+    }
+}
+
+/// Write `f(i)[j]` into `rows[j][i]` for every index `i` of equal-length rows, in parallel
+/// once the row length reaches the parallel threshold
+///
+/// Lets a kernel with several outputs per option fill caller-owned buffers (e.g. the rows
+/// of a (N, len) array) directly, without collecting per-option results first.
+pub fn fill_broadcast_rows<const N: usize, F>(rows: [&mut [f64]; N], f: F)
+where
+    F: Fn(usize) -> [f64; N] + Sync + Send,
+{
+    let len = rows.first().map_or(0, |row| row.len());
+    debug_assert!(rows.iter().all(|row| row.len() == len));
+
+    if len >= crate::constants::get_parallel_threshold() {
+        use rayon::prelude::*;
+        // Cut every row at the same boundaries so each task owns one block of columns
+        let block = len.div_ceil(rayon::current_num_threads() * 4);
+        let mut row_chunks = rows.map(|row| row.chunks_mut(block));
+        let blocks: Vec<[&mut [f64]; N]> = (0..len.div_ceil(block))
+            .map(|_| std::array::from_fn(|j| row_chunks[j].next().unwrap()))
+            .collect();
+        blocks
+            .into_par_iter()
+            .enumerate()
+            .for_each(|(b, block_rows)| fill_rows_from(b * block, block_rows, &f));
+    } else {
+        fill_rows_from(0, rows, &f);
+    }
+}
+
+/// Sequential body of `fill_broadcast_rows` for rows starting at output index `start`
+fn fill_rows_from<const N: usize, F>(start: usize, mut rows: [&mut [f64]; N], f: &F)
+where
+    F: Fn(usize) -> [f64; N],
+{
+    let len = rows.first().map_or(0, |row| row.len());
+    for i in 0..len {
+        for (row, value) in rows.iter_mut().zip(f(start + i)) {
+            row[i] = value;
+        }
+    }
+}
+
 /// Get the maximum length from multiple arrays
 /// Used to determine output length for broadcasting operations
 pub fn get_max_length(arrays: &[&Float64Array]) -> usize {
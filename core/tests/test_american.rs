@@ -63,6 +63,34 @@ mod scalar_tests {
         );
     }
 
+    #[test]
+    fn test_intrinsic_floor_across_grid() {
+        // Deep ITM points with dividends where the approximate critical price is
+        // off; e.g. s=199.6, k=126.6 used to price a call below s - k
+        for &(spot, strike) in &[(199.6, 126.6), (183.4, 85.4), (56.1, 70.3), (98.3, 189.4)] {
+            for &time in &[0.1, 0.5, 1.0, 2.0] {
+                for &rate in &[0.01, 0.05, 0.1] {
+                    for &dividend in &[0.01, 0.05, 0.08] {
+                        for &sigma in &[0.1, 0.25, 0.5] {
+                            let call =
+                                american_call_scalar(spot, strike, time, rate, dividend, sigma);
+                            let put =
+                                american_put_scalar(spot, strike, time, rate, dividend, sigma);
+                            assert!(
+                                call >= (spot - strike).max(0.0),
+                                "call {call} below intrinsic at s={spot} k={strike} t={time} r={rate} q={dividend} sigma={sigma}"
+                            );
+                            assert!(
+                                put >= (strike - spot).max(0.0),
+                                "put {put} below intrinsic at s={spot} k={strike} t={time} r={rate} q={dividend} sigma={sigma}"
+                            );
+                        }
+                    }
+                }
+            }
+        }
+    }
+
     #[test]
     fn test_american_european_relationship() {
         // American option must be worth at least as much as European
@@ -244,6 +272,33 @@ mod scalar_tests {
         );
     }
 
+    #[test]
+    fn test_boundary_cache_matches_uncached() {
+        // One cache shared across a spot ladder whose parameters change mid-way,
+        // alternating calls and puts, must reproduce the uncached prices exactly
+        let mut cache = BoundaryCache::default();
+        for i in 0..120 {
+            let spot = 40.0 + i as f64;
+            let sigma = if i < 60 { 0.2 } else { 0.35 };
+            let (cached, uncached) = if i % 3 == 0 {
+                (
+                    american_put_scalar_cached(spot, 100.0, 1.0, 0.05, 0.03, sigma, &mut cache),
+                    american_put_scalar(spot, 100.0, 1.0, 0.05, 0.03, sigma),
+                )
+            } else {
+                (
+                    american_call_scalar_cached(spot, 100.0, 1.0, 0.05, 0.03, sigma, &mut cache),
+                    american_call_scalar(spot, 100.0, 1.0, 0.05, 0.03, sigma),
+                )
+            };
+            assert_eq!(
+                cached.to_bits(),
+                uncached.to_bits(),
+                "spot={spot} sigma={sigma}"
+            );
+        }
+    }
+
     #[test]
     fn test_monotonicity_in_volatility() {
         // Option value should increase with volatility
@@ -334,6 +389,64 @@ mod binomial_tests {
         );
     }
 
+    /// Direct node-by-node CRR tree, used as a reference for the optimized sweep
+    #[allow(clippy::too_many_arguments)]
+    fn reference_binomial(
+        s: f64,
+        k: f64,
+        t: f64,
+        r: f64,
+        q: f64,
+        sigma: f64,
+        n_steps: usize,
+        is_call: bool,
+    ) -> f64 {
+        let dt = t / n_steps as f64;
+        let u = (sigma * dt.sqrt()).exp();
+        let d = 1.0 / u;
+        let p = (((r - q) * dt).exp() - d) / (u - d);
+        let discount = (-r * dt).exp();
+        let payoff = |spot: f64| {
+            if is_call {
+                (spot - k).max(0.0)
+            } else {
+                (k - spot).max(0.0)
+            }
+        };
+
+        let mut values: Vec<f64> = (0..=n_steps)
+            .map(|i| payoff(s * u.powi(i as i32) * d.powi((n_steps - i) as i32)))
+            .collect();
+        for step in (0..n_steps).rev() {
+            for i in 0..=step {
+                let spot = s * u.powi(i as i32) * d.powi((step - i) as i32);
+                let hold = discount * (p * values[i + 1] + (1.0 - p) * values[i]);
+                values[i] = hold.max(payoff(spot));
+            }
+        }
+        values[0]
+    }
+
+    #[test]
+    fn test_binomial_matches_reference_tree() {
+        // Odd and even step counts exercise both spot-table parities in the sweep
+        let sigma = 0.25;
+        for &n_steps in &[1, 2, 3, 50, 51] {
+            for &spot in &[80.0, 100.0, 120.0] {
+                for is_call in [true, false] {
+                    let expected =
+                        reference_binomial(spot, 100.0, 1.0, 0.05, 0.03, sigma, n_steps, is_call);
+                    let actual =
+                        american_binomial(spot, 100.0, 1.0, 0.05, 0.03, sigma, n_steps, is_call);
+                    assert!(
+                        (actual - expected).abs() <= 1e-10 * expected.abs().max(1.0),
+                        "n_steps={n_steps} spot={spot} is_call={is_call}: {actual} vs {expected}"
+                    );
+                }
+            }
+        }
+    }
+
     #[test]
     fn test_binomial_memory_efficiency() {
         // Ensure binomial uses O(n) memory, not O(n^2)
@@ -12,6 +12,7 @@ from typing import Any, Final
 
 import numpy as np
 import pyarrow as pa
+import pytest
 
 # ===== 精度レベル定義 =====
 # Rustのsrc/constants.rsと同期
@@ -119,9 +120,9 @@ class ArrowArrayHelper:
         if op == "all_positive":
             assert all(v >= 0 for v in values), "負の値が含まれています"
         elif op == "increasing":
-            assert all(values[i] < values[i + 1] for i in range(len(values) - 1)), "単調増加でありません"
+            assert np.all(np.diff(values) > 0), "単調増加でありません"
         elif op == "decreasing":
-            assert all(values[i] > values[i + 1] for i in range(len(values) - 1)), "単調減少でありません"
+            assert np.all(np.diff(values) < 0), "単調減少でありません"
         elif op == "all_finite":
             assert all(np.isfinite(v) for v in values), "無限大またはNaNが含まれています"
 
@@ -154,3 +155,45 @@ def create_test_array(values: list[float] | float, array_type: str) -> Any:
         return pa.array(values, type=pa.float64())  # type: ignore[attr-defined, call-arg]
     else:
         raise ValueError(f"Unknown array type: {array_type}")
+
+
+# ===== セッション共通フィクスチャ =====
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _quantforge_warmup() -> None:
+    """拡張モジュールを事前に呼び出し、初回呼び出しコストを各テストから除外する
+
+    動的リンク・ページフォールト等の初回コストが最初のテストの計測に混入しないよう、
+    スカラー・グリークス・バッチの各経路をセッション開始時に1回ずつ実行する。
+    rayonのスレッドプールも遅延初期化されるため、並列閾値を超えるバッチで起動しておく。
+    """
+    from quantforge import american, black_scholes, merton
+
+    black_scholes.call_price(100.0, 100.0, 1.0, 0.05, 0.2)
+    black_scholes.greeks(100.0, 100.0, 1.0, 0.05, 0.2, is_call=True)
+    merton.call_price(100.0, 100.0, 1.0, 0.05, 0.02, 0.2)
+    merton.call_price_batch(np.array([100.0]), 100.0, 1.0, 0.05, 0.02, 0.2)
+    american.call_price(100.0, 100.0, 1.0, 0.05, 0.02, 0.2)
+    american.call_price_batch(np.array([100.0]), 100.0, 1.0, 0.05, 0.02, 0.2)
+    # 既定の並列閾値（10,000件）以上: 並列経路を通してスレッドプールを初期化
+    merton.call_price_batch(np.full(10_000, 100.0), 100.0, 1.0, 0.05, 0.02, 0.2)
+
+
+def _readonly(values: list[float]) -> np.ndarray:
+    """書き込み不可のfloat64配列を作成（セッション共有入力の誤変更を防止）"""
+    array = np.array(values, dtype=np.float64)
+    array.setflags(write=False)
+    return array
+
+
+@pytest.fixture(scope="session")
+def spots3() -> np.ndarray:
+    """バッチテスト共通のスポット配列 [90, 100, 110]（読み取り専用）"""
+    return _readonly([90.0, 100.0, 110.0])
+
+
+@pytest.fixture(scope="session")
+def strikes3() -> np.ndarray:
+    """バッチテスト共通のATM行使価格配列 [100, 100, 100]（読み取り専用）"""
+    return _readonly([100.0, 100.0, 100.0])
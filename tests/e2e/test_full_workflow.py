@@ -75,12 +75,13 @@ class TestE2EWorkflows:
     def test_data_pipeline(self):
         """Test data processing pipeline."""
         # Simulate market data
+        rng = np.random.default_rng(42)
         market_data = {
-            "spots": np.random.uniform(90, 110, 100),
-            "strikes": np.random.uniform(95, 105, 100),
-            "times": np.random.uniform(0.1, 2.0, 100),
+            "spots": rng.uniform(90, 110, 100),
+            "strikes": rng.uniform(95, 105, 100),
+            "times": rng.uniform(0.1, 2.0, 100),
             "rates": 0.05,
-            "sigmas": np.random.uniform(0.1, 0.4, 100),
+            "sigmas": rng.uniform(0.1, 0.4, 100),
         }
 
         # Calculate prices
@@ -149,7 +150,8 @@ class TestE2EWorkflows:
         rate = 0.05
 
         # Generate synthetic market prices
-        market_vols = np.random.uniform(0.15, 0.35, (len(times), len(strikes)))
+        rng = np.random.default_rng(42)
+        market_vols = rng.uniform(0.15, 0.35, (len(times), len(strikes)))
 
         results = []
         for t_idx, time in enumerate(times):
@@ -113,10 +113,10 @@ class TestBlackScholesIntegration:
 
     def test_batch_vs_single_consistency(self) -> None:
         """バッチ処理と単一処理の一貫性テスト."""
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
         n = 1000
 
-        spots = np.random.uniform(50, 150, n)
+        spots = rng.uniform(50, 150, n)
         k = 100.0
         t = 1.0
         r = 0.05
@@ -126,7 +126,7 @@ class TestBlackScholesIntegration:
         batch_prices = black_scholes.call_price_batch(spots, k, t, r, sigma)
 
         # 単一処理との比較（サンプリング）
-        sample_indices = np.random.choice(n, 100, replace=False)
+        sample_indices = rng.choice(n, 100, replace=False)
         for idx in sample_indices:
             single_price = black_scholes.call_price(spots[idx], k, t, r, sigma)
             # Convert Arrow scalar to Python float if needed
@@ -137,8 +137,9 @@ class TestBlackScholesIntegration:
 
     def test_large_scale_batch(self) -> None:
         """大規模バッチ処理のテスト."""
+        rng = np.random.default_rng(42)
         n = 1000000
-        spots = np.random.uniform(50, 150, n)
+        spots = rng.uniform(50, 150, n)
         k = 100.0
         t = 1.0
         r = 0.05
@@ -228,18 +229,18 @@ class TestBlackScholesAccuracy:
 
     def test_comparison_with_scipy(self) -> None:
         """SciPy実装との詳細比較."""
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
         n_tests = 1000
 
         max_rel_error = 0.0
         max_abs_error = 0.0
 
         for _ in range(n_tests):
-            s = np.random.uniform(50, 150)
-            k = np.random.uniform(50, 150)
-            t = np.random.uniform(0.01, 5.0)
-            r = np.random.uniform(-0.05, 0.15)
-            sigma = np.random.uniform(0.05, 0.5)
+            s = rng.uniform(50, 150)
+            k = rng.uniform(50, 150)
+            t = rng.uniform(0.01, 5.0)
+            r = rng.uniform(-0.05, 0.15)
+            sigma = rng.uniform(0.05, 0.5)
 
             # QuantForge実装
             qf_price = black_scholes.call_price(s, k, t, r, sigma)
@@ -9,7 +9,7 @@ from quantforge import black_scholes  # type: ignore[import-untyped]
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from conftest import INPUT_ARRAY_TYPES, PRACTICAL_TOLERANCE, arrow, create_test_array
+from conftest import INPUT_ARRAY_TYPES, NUMERICAL_TOLERANCE, PRACTICAL_TOLERANCE, arrow, create_test_array
 
 
 def test_put_single_calculation() -> None:
@@ -42,24 +42,30 @@ def test_put_batch_calculation(array_type: str) -> None:
 
 
 def test_put_call_parity() -> None:
-    """Put-Callパリティのテスト"""
-    s, k, t, r, sigma = 100.0, 100.0, 1.0, 0.05, 0.2
+    """Put-Callパリティのテスト（4つのパラメータ組み合わせを一括計算）"""
+    # ATM, ITM, OTM, 短期・高ボラティリティ
+    spots = np.array([100.0, 110.0, 90.0, 100.0])
+    strikes = np.array([100.0, 100.0, 100.0, 105.0])
+    times = np.array([1.0, 0.5, 2.0, 0.25])
+    rates = np.array([0.05, 0.03, 0.07, 0.01])
+    sigmas = np.array([0.2, 0.25, 0.15, 0.4])
 
-    call = black_scholes.call_price(s, k, t, r, sigma)
-    put = black_scholes.put_price(s, k, t, r, sigma)
+    calls = np.asarray(black_scholes.call_price_batch(spots, strikes, times, rates, sigmas))
+    puts = np.asarray(black_scholes.put_price_batch(spots, strikes, times, rates, sigmas))
 
     # C - P = S - K*exp(-r*T)
-    parity_lhs = call - put
-    parity_rhs = s - k * np.exp(-r * t)
+    parity_lhs = calls - puts
+    parity_rhs = spots - strikes * np.exp(-rates * times)
 
-    assert abs(parity_lhs - parity_rhs) < 1e-7  # 数値精度レベルで一致
+    np.testing.assert_allclose(parity_lhs, parity_rhs, atol=NUMERICAL_TOLERANCE)  # 数値精度レベルで一致
 
 
 @pytest.mark.parametrize("array_type", INPUT_ARRAY_TYPES)
 def test_put_large_batch_performance(array_type: str) -> None:
     """大規模バッチのパフォーマンステスト（NumPyとPyArrow両方）"""
+    rng = np.random.default_rng(42)
     n = 100000
-    spots_np = np.random.uniform(50, 150, n)
+    spots_np = rng.uniform(50, 150, n)
     spots = create_test_array(spots_np.tolist(), array_type)
 
     # エラーなく実行できることを確認
@@ -0,0 +1,68 @@
+"""Batch vs. scalar throughput benchmarks for QuantForge pricing.
+
+Replaces the wall-clock assertions that used to live in the unit suite
+(tests/test_models_unified.py::test_vectorized_performance). pytest-benchmark
+handles warmup and statistics, so numbers are comparable across runs.
+"""
+
+import numpy as np
+import pytest
+import quantforge as qf
+
+BATCH_SIZE = 10000
+SEQUENTIAL_SIZE = 100
+# Far above the parallel threshold so the rayon path in *_batch is what gets measured
+LARGE_BATCH_SIZE = 100_000
+
+
+@pytest.fixture(scope="module")
+def batch_inputs() -> dict[str, np.ndarray]:
+    """Seeded random Black-Scholes inputs shared by all throughput benchmarks."""
+    rng = np.random.default_rng(42)
+    return {
+        "spots": rng.uniform(80, 120, BATCH_SIZE),
+        "strikes": rng.uniform(90, 110, BATCH_SIZE),
+        "times": rng.uniform(0.1, 2.0, BATCH_SIZE),
+        "rates": rng.uniform(0.01, 0.1, BATCH_SIZE),
+        "sigmas": rng.uniform(0.1, 0.5, BATCH_SIZE),
+    }
+
+
+@pytest.mark.benchmark
+class TestBatchThroughput:
+    """Throughput of call_price_batch against a sequential call_price loop."""
+
+    def test_call_price_batch(self, benchmark, batch_inputs):
+        """Benchmark one call_price_batch over the full batch."""
+        result = benchmark(qf.black_scholes.call_price_batch, **batch_inputs)
+        assert len(result) == BATCH_SIZE
+
+    def test_call_price_sequential(self, benchmark, batch_inputs):
+        """Benchmark a scalar call_price loop over a bounded prefix."""
+        spots = batch_inputs["spots"]
+        strikes = batch_inputs["strikes"]
+        times = batch_inputs["times"]
+        rates = batch_inputs["rates"]
+        sigmas = batch_inputs["sigmas"]
+
+        def sequential():
+            prices = np.empty(SEQUENTIAL_SIZE)
+            for i in range(SEQUENTIAL_SIZE):
+                prices[i] = qf.black_scholes.call_price(spots[i], strikes[i], times[i], rates[i], sigmas[i])
+            return prices
+
+        result = benchmark(sequential)
+        assert len(result) == SEQUENTIAL_SIZE
+
+
+@pytest.mark.benchmark
+@pytest.mark.slow
+class TestLargeBatchThroughput:
+    """Throughput of American batch pricing at a size that runs the parallel path."""
+
+    def test_american_call_price_batch(self, benchmark):
+        """Benchmark one American call_price_batch over a large spot grid."""
+        spots = np.linspace(50, 150, LARGE_BATCH_SIZE)
+        result = benchmark(qf.american.call_price_batch, spots, 100.0, 1.0, 0.05, 0.02, 0.2)
+        assert len(result) == LARGE_BATCH_SIZE
+        assert np.all(np.diff(result) >= 0)
@@ -2,39 +2,74 @@
 
 import math
 
+import numpy as np
+import pytest
 from quantforge.models import american, merton
 
 # Test tolerances
 THEORETICAL_TOLERANCE = 1e-3
 PRACTICAL_TOLERANCE = 1e-2
 
+# Discount factor for the standard parameters (r=0.05, t=1.0)
+RATE_DISCOUNT_1Y = math.exp(-0.05 * 1.0)
+
+
+@pytest.fixture(scope="module")
+def atm_european() -> dict[str, float]:
+    """European (Merton) ATM reference prices, with and without dividend, computed once per module."""
+    return {
+        "call": merton.call_price(s=100.0, k=100.0, t=1.0, r=0.05, q=0.0, sigma=0.2),
+        "call_div": merton.call_price(s=100.0, k=100.0, t=1.0, r=0.05, q=0.02, sigma=0.2),
+        "put": merton.put_price(s=100.0, k=100.0, t=1.0, r=0.05, q=0.0, sigma=0.2),
+        "put_div": merton.put_price(s=100.0, k=100.0, t=1.0, r=0.05, q=0.02, sigma=0.2),
+    }
+
+
+@pytest.fixture(scope="module")
+def atm_american() -> dict[str, float]:
+    """American ATM prices without dividend, computed once per module."""
+    return {
+        "call": american.call_price(s=100.0, k=100.0, t=1.0, r=0.05, q=0.0, sigma=0.2),
+        "put": american.put_price(s=100.0, k=100.0, t=1.0, r=0.05, q=0.0, sigma=0.2),
+    }
+
+
+@pytest.fixture(scope="module")
+def exercise_boundaries() -> dict[str, float]:
+    """Exercise boundaries at k=100, t=1, r=0.05, sigma=0.2, computed once per module."""
+    params = {"k": 100.0, "t": 1.0, "r": 0.05, "sigma": 0.2}
+    return {
+        "call": american.exercise_boundary(**params, q=0.03, is_call=True),  # type: ignore[attr-defined]
+        "put": american.exercise_boundary(**params, q=0.03, is_call=False),  # type: ignore[attr-defined]
+        "call_no_div": american.exercise_boundary(**params, q=0.0, is_call=True),  # type: ignore[attr-defined]
+    }
+
 
 class TestAmericanCallPrice:
     """Test American call price calculation."""
 
-    def test_call_price_atm(self) -> None:
+    def test_call_price_atm(self, atm_european: dict[str, float], atm_american: dict[str, float]) -> None:
         """Test call price for at-the-money American option."""
-        price = american.call_price(s=100.0, k=100.0, t=1.0, r=0.05, q=0.0, sigma=0.2)
+        price = atm_american["call"]
         assert price > 0
         assert price < 100.0
         # American call should be at least as valuable as European
-        euro_price = merton.call_price(s=100.0, k=100.0, t=1.0, r=0.05, q=0.0, sigma=0.2)
-        assert price >= euro_price - THEORETICAL_TOLERANCE
+        assert price >= atm_european["call"] - THEORETICAL_TOLERANCE
 
-    def test_call_price_with_dividend(self) -> None:
+    def test_call_price_with_dividend(self, atm_european: dict[str, float]) -> None:
         """Test American call with dividend."""
         price = american.call_price(s=100.0, k=100.0, t=1.0, r=0.05, q=0.02, sigma=0.2)
         assert price > 0
         # With dividends, American call can be exercised early
-        euro_price = merton.call_price(s=100.0, k=100.0, t=1.0, r=0.05, q=0.02, sigma=0.2)
-        assert price >= euro_price - THEORETICAL_TOLERANCE
+        assert price >= atm_european["call_div"] - THEORETICAL_TOLERANCE
 
-    def test_call_price_no_early_exercise_value(self) -> None:
+    def test_call_price_no_early_exercise_value(
+        self, atm_european: dict[str, float], atm_american: dict[str, float]
+    ) -> None:
         """Test American call when early exercise has no value (no dividends)."""
-        price = american.call_price(s=100.0, k=100.0, t=1.0, r=0.05, q=0.0, sigma=0.2)
-        euro_price = merton.call_price(s=100.0, k=100.0, t=1.0, r=0.05, q=0.0, sigma=0.2)
+        price = atm_american["call"]
         # Without dividends, American call should equal European call
-        assert abs(price - euro_price) < PRACTICAL_TOLERANCE
+        assert abs(price - atm_european["call"]) < PRACTICAL_TOLERANCE
 
     def test_call_price_deep_itm(self) -> None:
         """Test American call for deep in-the-money option."""
@@ -43,7 +78,7 @@ class TestAmericanCallPrice:
         intrinsic = 200.0 - 100.0
         assert price >= intrinsic
         # Should be at least as valuable as discounted intrinsic
-        assert price >= intrinsic * math.exp(-0.05 * 1.0)
+        assert price >= intrinsic * RATE_DISCOUNT_1Y
 
     def test_call_price_deep_otm(self) -> None:
         """Test American call for deep out-of-the-money option."""
@@ -57,28 +92,27 @@ class TestAmericanCallPrice:
 class TestAmericanPutPrice:
     """Test American put price calculation."""
 
-    def test_put_price_atm(self) -> None:
+    def test_put_price_atm(self, atm_european: dict[str, float], atm_american: dict[str, float]) -> None:
         """Test put price for at-the-money American option."""
-        price = american.put_price(s=100.0, k=100.0, t=1.0, r=0.05, q=0.0, sigma=0.2)
+        price = atm_american["put"]
         assert price > 0
         assert price < 100.0
         # American put should be more valuable than European
-        euro_price = merton.put_price(s=100.0, k=100.0, t=1.0, r=0.05, q=0.0, sigma=0.2)
-        assert price >= euro_price - THEORETICAL_TOLERANCE
+        assert price >= atm_european["put"] - THEORETICAL_TOLERANCE
 
-    def test_put_price_with_dividend(self) -> None:
+    def test_put_price_with_dividend(self, atm_european: dict[str, float]) -> None:
         """Test American put with dividend."""
         price = american.put_price(s=100.0, k=100.0, t=1.0, r=0.05, q=0.02, sigma=0.2)
         assert price > 0
-        euro_price = merton.put_price(s=100.0, k=100.0, t=1.0, r=0.05, q=0.02, sigma=0.2)
-        assert price >= euro_price - THEORETICAL_TOLERANCE
+        assert price >= atm_european["put_div"] - THEORETICAL_TOLERANCE
 
-    def test_put_price_early_exercise_premium(self) -> None:
+    def test_put_price_early_exercise_premium(
+        self, atm_european: dict[str, float], atm_american: dict[str, float]
+    ) -> None:
         """Test American put early exercise premium."""
-        price = american.put_price(s=100.0, k=100.0, t=1.0, r=0.05, q=0.0, sigma=0.2)
-        euro_price = merton.put_price(s=100.0, k=100.0, t=1.0, r=0.05, q=0.0, sigma=0.2)
+        price = atm_american["put"]
         # American put should have early exercise premium
-        assert price > euro_price
+        assert price > atm_european["put"]
 
     def test_put_price_deep_itm(self) -> None:
         """Test American put for deep in-the-money option."""
@@ -139,12 +173,10 @@ class TestAmericanGreeks:
 class TestAmericanBatchOperations:
     """Test batch operations for American options."""
 
-    def test_call_price_batch(self) -> None:
+    def test_call_price_batch(self, spots3: np.ndarray, strikes3: np.ndarray) -> None:
         """Test batch calculation of American call prices."""
-        import numpy as np
-
-        spots = np.array([90.0, 100.0, 110.0])
-        strikes = np.array([100.0, 100.0, 100.0])
+        spots = spots3
+        strikes = strikes3
         times = 1.0
         rates = 0.05
         dividend_yields = 0.02
@@ -153,16 +185,14 @@ class TestAmericanBatchOperations:
         prices = american.call_price_batch(spots, strikes, times, rates, dividend_yields, sigmas)
 
         assert len(prices) == 3
-        assert all(p >= 0 for p in prices)
+        assert np.all(prices >= 0)
         # Prices should increase with spot
-        assert prices[0] < prices[1] < prices[2]
+        assert np.all(np.diff(prices) > 0)
 
-    def test_put_price_batch(self) -> None:
+    def test_put_price_batch(self, spots3: np.ndarray, strikes3: np.ndarray) -> None:
         """Test batch calculation of American put prices."""
-        import numpy as np
-
-        spots = np.array([90.0, 100.0, 110.0])
-        strikes = np.array([100.0, 100.0, 100.0])
+        spots = spots3
+        strikes = strikes3
         times = 1.0
         rates = 0.05
         dividend_yields = 0.02
@@ -171,15 +201,13 @@ class TestAmericanBatchOperations:
         prices = american.put_price_batch(spots, strikes, times, rates, dividend_yields, sigmas)
 
         assert len(prices) == 3
-        assert all(p >= 0 for p in prices)
+        assert np.all(prices >= 0)
         # Prices should decrease with spot
-        assert prices[0] > prices[1] > prices[2]
+        assert np.all(np.diff(prices) < 0)
 
-    def test_greeks_batch(self) -> None:
+    def test_greeks_batch(self, spots3: np.ndarray) -> None:
         """Test batch calculation of American Greeks."""
-        import numpy as np
-
-        spots = np.array([90.0, 100.0, 110.0])
+        spots = spots3
         strikes = 100.0
         times = 1.0
         rates = 0.05
@@ -188,16 +216,62 @@ class TestAmericanBatchOperations:
 
         greeks = american.greeks_batch(spots, strikes, times, rates, dividend_yields, sigmas, is_calls=True)
 
-        assert "delta" in greeks
-        assert "gamma" in greeks
-        assert "vega" in greeks
-        assert "theta" in greeks
-        assert "rho" in greeks
+        for name in ("delta", "gamma", "vega", "theta", "rho", "dividend_rho"):
+            values = np.asarray(greeks[name])
+            assert values.dtype == np.float64 and values.shape == (3,), name
+        assert np.all(np.asarray(greeks["dividend_rho"]) == 0.0)
 
-        assert len(greeks["delta"]) == 3
-        assert all(0 < d < 1 for d in greeks["delta"])
+        deltas = np.asarray(greeks["delta"])
+        assert np.all((deltas > 0) & (deltas < 1))
         # Delta should increase with spot for calls
-        assert greeks["delta"][0] < greeks["delta"][1] < greeks["delta"][2]
+        assert np.all(np.diff(deltas) > 0)
+
+    @pytest.mark.parametrize("is_call", [True, False])
+    def test_greeks_batch_matches_scalar(self, is_call: bool) -> None:
+        """Test batch Greeks reproduce the scalar Greeks over a spot ladder."""
+        spots = np.linspace(80.0, 120.0, 9)
+        greeks = american.greeks_batch(spots, 100.0, 0.5, 0.05, 0.02, 0.25, is_calls=is_call)
+        scalar = [american.greeks(s=s, k=100.0, t=0.5, r=0.05, q=0.02, sigma=0.25, is_call=is_call) for s in spots]
+
+        for name in ("delta", "gamma", "vega", "theta", "rho"):
+            np.testing.assert_allclose(greeks[name], [g[name] for g in scalar], atol=1e-10, err_msg=name)
+
+    def test_greeks_batch_out(self, spots3: np.ndarray) -> None:
+        """Test batch Greeks written into a caller-supplied (6, N) buffer."""
+        expected = american.greeks_batch(spots3, 100.0, 1.0, 0.05, 0.02, 0.2, is_calls=False)
+        out = np.full((6, 3), np.nan)
+
+        greeks = american.greeks_batch(spots3, 100.0, 1.0, 0.05, 0.02, 0.2, is_calls=False, out=out)
+
+        np.testing.assert_array_equal(out[5], 0.0)
+        for row, name in enumerate(("delta", "gamma", "vega", "theta", "rho", "dividend_rho")):
+            assert np.shares_memory(greeks[name], out), name
+            np.testing.assert_array_equal(out[row], expected[name], err_msg=name)
+            np.testing.assert_array_equal(greeks[name], expected[name], err_msg=name)
+
+    @pytest.mark.parametrize(
+        "out",
+        [
+            np.empty((6, 4)),
+            np.empty((5, 3)),
+            np.empty((3, 6)),
+            np.empty((6, 3), dtype=np.float64, order="F"),
+            np.empty((6, 6))[:, ::2],
+        ],
+        ids=["wrong_length", "five_rows", "transposed_shape", "f_order", "strided"],
+    )
+    def test_greeks_batch_out_rejected(self, spots3: np.ndarray, out: np.ndarray) -> None:
+        """Test that an out buffer of the wrong shape or layout is rejected."""
+        with pytest.raises(ValueError, match="out must"):
+            american.greeks_batch(spots3, 100.0, 1.0, 0.05, 0.02, 0.2, out=out)
+
+    def test_greeks_batch_out_readonly(self, spots3: np.ndarray) -> None:
+        """Test that a read-only out buffer is rejected."""
+        out = np.empty((6, 3))
+        out.flags.writeable = False
+
+        with pytest.raises(ValueError, match="out must be writeable"):
+            american.greeks_batch(spots3, 100.0, 1.0, 0.05, 0.02, 0.2, out=out)
 
 
 class TestAmericanImpliedVolatility:
@@ -225,44 +299,90 @@ class TestAmericanImpliedVolatility:
 
         assert abs(iv - target_vol) < 1e-4
 
-    def test_implied_volatility_batch(self) -> None:
+    def test_implied_volatility_batch(self, spots3: np.ndarray) -> None:
         """Test batch implied volatility calculation."""
-        import numpy as np
-
-        # Calculate prices with known volatility
-        spots = np.array([90.0, 100.0, 110.0])
-        target_vol = 0.25
-        prices = american.call_price_batch(spots, 100.0, 1.0, 0.05, 0.02, target_vol)
+        # Calculate prices with known per-element volatilities in one batch call
+        spots = spots3
+        target_vols = np.array([0.2, 0.25, 0.3])
+        prices = american.call_price_batch(spots, 100.0, 1.0, 0.05, 0.02, target_vols)
 
         # Solve for implied volatilities
         ivs = american.implied_volatility_batch(prices, spots, 100.0, 1.0, 0.05, 0.02, is_calls=True)
 
         assert len(ivs) == 3
-        assert all(abs(iv - target_vol) < 1e-3 for iv in ivs)
+        assert np.abs(ivs - target_vols).max() < THEORETICAL_TOLERANCE, f"IV mismatch: {ivs} vs {target_vols}"
+
+    @pytest.mark.parametrize("initial_guesses", [0.3, np.array([0.22, 0.27, 0.28])])
+    def test_implied_volatility_batch_initial_guesses(self, spots3: np.ndarray, initial_guesses: object) -> None:
+        """Test batch implied volatility from a scalar or per-option starting guess."""
+        target_vols = np.array([0.2, 0.25, 0.3])
+        prices = american.call_price_batch(spots3, 100.0, 1.0, 0.05, 0.02, target_vols)
+
+        ivs = american.implied_volatility_batch(
+            prices, spots3, 100.0, 1.0, 0.05, 0.02, is_calls=True, initial_guesses=initial_guesses
+        )
+
+        assert np.abs(ivs - target_vols).max() < THEORETICAL_TOLERANCE, f"IV mismatch: {ivs} vs {target_vols}"
+
+    @pytest.mark.parametrize(
+        "initial_guesses",
+        [np.array([0.2, 0.25]), 0.0, -0.2, np.array([0.2, np.nan, 0.3]), np.inf],
+    )
+    def test_implied_volatility_batch_invalid_initial_guesses(
+        self, spots3: np.ndarray, initial_guesses: object
+    ) -> None:
+        """Test that wrong-length, non-positive or non-finite guesses are rejected."""
+        prices = american.call_price_batch(spots3, 100.0, 1.0, 0.05, 0.02, 0.2)
+
+        with pytest.raises(ValueError, match="initial_guesses"):
+            american.implied_volatility_batch(
+                prices, spots3, 100.0, 1.0, 0.05, 0.02, is_calls=True, initial_guesses=initial_guesses
+            )
+
+    @pytest.mark.parametrize(
+        "is_call, q, t, sigma",
+        [(True, 0.02, 0.5, 0.8), (False, 0.05, 1.0, 0.5)],
+    )
+    def test_implied_volatility_batch_default_seed_itm_otm(
+        self, is_call: bool, q: float, t: float, sigma: float
+    ) -> None:
+        """Test the default per-option seed across an ITM-to-OTM grid.
+
+        Starting every option from a fixed 0.2 leaves the deep ITM and OTM
+        strikes of these grids unconverged (NaN).
+        """
+        spots = np.linspace(60.0, 160.0, 11)
+        price_batch = american.call_price_batch if is_call else american.put_price_batch
+        prices = price_batch(spots, 100.0, t, 0.05, q, sigma)
+
+        ivs = american.implied_volatility_batch(prices, spots, 100.0, t, 0.05, q, is_calls=is_call)
+
+        assert np.all(np.isfinite(ivs)), f"Unconverged IVs at spots {spots[~np.isfinite(ivs)]}"
+        assert np.abs(ivs - sigma).max() < THEORETICAL_TOLERANCE
 
 
 class TestAmericanExerciseBoundary:
     """Test American option exercise boundary calculation."""
 
-    def test_exercise_boundary_call(self) -> None:
+    def test_exercise_boundary_call(self, exercise_boundaries: dict[str, float]) -> None:
         """Test exercise boundary for American call option."""
-        boundary = american.exercise_boundary(k=100.0, t=1.0, r=0.05, q=0.03, sigma=0.2, is_call=True)  # type: ignore[attr-defined]
+        boundary = exercise_boundaries["call"]
 
         # Call boundary should be above strike when there are dividends
         assert boundary > 100.0
         assert boundary < float("inf")
 
-    def test_exercise_boundary_put(self) -> None:
+    def test_exercise_boundary_put(self, exercise_boundaries: dict[str, float]) -> None:
         """Test exercise boundary for American put option."""
-        boundary = american.exercise_boundary(k=100.0, t=1.0, r=0.05, q=0.03, sigma=0.2, is_call=False)  # type: ignore[attr-defined]
+        boundary = exercise_boundaries["put"]
 
         # Put boundary should be below strike
         assert boundary < 100.0
         assert boundary > 0.0
 
-    def test_exercise_boundary_no_dividends(self) -> None:
+    def test_exercise_boundary_no_dividends(self, exercise_boundaries: dict[str, float]) -> None:
         """Test exercise boundary for call with no dividends."""
-        boundary = american.exercise_boundary(k=100.0, t=1.0, r=0.05, q=0.0, sigma=0.2, is_call=True)  # type: ignore[attr-defined]
+        boundary = exercise_boundaries["call_no_div"]
 
         # Without dividends, American call should never be exercised early
         assert boundary == float("inf")
@@ -283,8 +403,6 @@ class TestAmericanExerciseBoundary:
 
     def test_exercise_boundary_batch(self) -> None:
         """Test batch exercise boundary calculation."""
-        import numpy as np
-
         strikes = np.array([95.0, 100.0, 105.0])
         times = np.array([0.5, 1.0, 1.5])
         boundaries = american.exercise_boundary_batch(  # type: ignore[attr-defined]
@@ -296,10 +414,9 @@ class TestAmericanExerciseBoundary:
 
         assert len(boundaries_array) == 3
         # All call boundaries should be above their strikes (with dividends)
-        for i in range(3):
-            assert boundaries_array[i] > strikes[i]
+        assert np.all(boundaries_array > strikes)
 
-    def test_exercise_boundary_consistency(self) -> None:
+    def test_exercise_boundary_consistency(self, exercise_boundaries: dict[str, float]) -> None:
         """Test that exercise boundary is consistent with pricing."""
         k = 100.0
         t = 1.0
@@ -308,7 +425,7 @@ class TestAmericanExerciseBoundary:
         sigma = 0.2
 
         # Get the exercise boundary
-        boundary = american.exercise_boundary(k, t, r, q, sigma, is_call=False)  # type: ignore[attr-defined]
+        boundary = exercise_boundaries["put"]
 
         # Price at the boundary should be close to intrinsic value
         put_price = american.put_price(s=boundary, k=k, t=t, r=r, q=q, sigma=sigma)
@@ -318,6 +435,46 @@ class TestAmericanExerciseBoundary:
         assert abs(put_price - intrinsic) < 0.1
 
 
+class TestAmericanProperties:
+    """Test mathematical properties of American option pricing."""
+
+    def test_call_price_monotonicity_spot(self) -> None:
+        """Test call price increases with spot."""
+        spots = np.linspace(80, 120, 10)
+        prices = american.call_price_batch(spots, 100.0, 1.0, 0.05, 0.03, 0.2)
+        assert np.all(np.diff(prices) > 0), f"Call prices not increasing in spot: {prices}"
+
+    def test_put_price_monotonicity_spot(self) -> None:
+        """Test put price decreases with spot."""
+        spots = np.linspace(80, 120, 10)
+        prices = american.put_price_batch(spots, 100.0, 1.0, 0.05, 0.03, 0.2)
+        assert np.all(np.diff(prices) < 0), f"Put prices not decreasing in spot: {prices}"
+
+    def test_random_batch_invariants(self) -> None:
+        """Test American >= max(European, intrinsic) and spot monotonicity over a seeded random batch."""
+        rng = np.random.default_rng(0)
+        n = 1024
+        s = rng.uniform(50, 200, n)
+        k = rng.uniform(50, 200, n)
+        t = rng.uniform(0.05, 2.0, n)
+        r = rng.uniform(0.0, 0.1, n)
+        q = rng.uniform(0.0, 0.08, n)
+        sigma = rng.uniform(0.1, 0.5, n)
+
+        calls = american.call_price_batch(s, k, t, r, q, sigma)
+        puts = american.put_price_batch(s, k, t, r, q, sigma)
+        assert np.all(calls >= np.asarray(merton.call_price_batch(s, k, t, r, q, sigma)) - THEORETICAL_TOLERANCE)
+        assert np.all(puts >= np.asarray(merton.put_price_batch(s, k, t, r, q, sigma)) - THEORETICAL_TOLERANCE)
+        # Early exercise is always available, so neither side may fall below intrinsic
+        assert np.all(calls >= np.maximum(s - k, 0.0))
+        assert np.all(puts >= np.maximum(k - s, 0.0))
+
+        # A 1% spot bump must not lower calls or raise puts
+        bumped = s * 1.01
+        assert np.all(american.call_price_batch(bumped, k, t, r, q, sigma) >= calls - THEORETICAL_TOLERANCE)
+        assert np.all(american.put_price_batch(bumped, k, t, r, q, sigma) <= puts + THEORETICAL_TOLERANCE)
+
+
 class TestAmericanBinomial:
     """Test American option binomial tree calculation."""
 
@@ -349,21 +506,12 @@ class TestAmericanBinomial:
 
     def test_binomial_convergence(self) -> None:
         """Test that binomial price converges with more steps."""
-        # Calculate with different step counts
-        price_50 = american.binomial_tree(s=100.0, k=100.0, t=1.0, r=0.05, q=0.03, sigma=0.2, n_steps=50, is_call=True)  # type: ignore[attr-defined]
-        price_100 = american.binomial_tree(  # type: ignore[attr-defined]
-            s=100.0, k=100.0, t=1.0, r=0.05, q=0.03, sigma=0.2, n_steps=100, is_call=True
-        )
-        price_200 = american.binomial_tree(  # type: ignore[attr-defined]
-            s=100.0, k=100.0, t=1.0, r=0.05, q=0.03, sigma=0.2, n_steps=200, is_call=True
-        )
-
-        # Higher step counts should converge
-        diff_1 = abs(price_100 - price_50)
-        diff_2 = abs(price_200 - price_100)
+        params = {"s": 100.0, "k": 100.0, "t": 1.0, "r": 0.05, "q": 0.03, "sigma": 0.2, "is_call": True}
+        prices = np.array([american.binomial_tree(**params, n_steps=n) for n in (50, 100, 200)])  # type: ignore[attr-defined]
 
-        # Convergence: differences should decrease
-        assert diff_2 < diff_1
+        # Convergence: differences between successive step counts should decrease
+        diffs = np.abs(np.diff(prices))
+        assert diffs[1] < diffs[0]
 
     def test_binomial_vs_analytical(self) -> None:
         """Test binomial approximation vs analytical approximation."""
@@ -6,6 +6,7 @@ import numpy as np
 import pytest
 from quantforge.models import black76
 
+from tests.base_testing import to_numpy_array
 from tests.conftest import (
     INPUT_ARRAY_TYPES,
     THEORETICAL_TOLERANCE,
@@ -13,6 +14,9 @@ from tests.conftest import (
     create_test_array,
 )
 
+# Discount factor for the standard parameters (r=0.05, t=1.0)
+RATE_DISCOUNT_1Y = math.exp(-0.05 * 1.0)
+
 
 class TestBlack76CallPrice:
     """Test Black76 call price calculation for futures options."""
@@ -27,7 +31,7 @@ class TestBlack76CallPrice:
     def test_call_price_itm(self) -> None:
         """Test call price for in-the-money futures option."""
         price = black76.call_price(f=110.0, k=100.0, t=1.0, r=0.05, sigma=0.2)
-        intrinsic = (110.0 - 100.0) * math.exp(-0.05 * 1.0)
+        intrinsic = (110.0 - 100.0) * RATE_DISCOUNT_1Y
         assert price > intrinsic  # Must be worth at least intrinsic value
 
     def test_call_price_otm(self) -> None:
@@ -39,7 +43,7 @@ class TestBlack76CallPrice:
     def test_call_price_deep_itm(self) -> None:
         """Test call price for deep in-the-money futures option."""
         price = black76.call_price(f=200.0, k=100.0, t=1.0, r=0.05, sigma=0.2)
-        intrinsic = (200.0 - 100.0) * math.exp(-0.05 * 1.0)
+        intrinsic = (200.0 - 100.0) * RATE_DISCOUNT_1Y
         assert abs(price - intrinsic) < 1.0  # Should be close to intrinsic
 
     def test_call_price_deep_otm(self) -> None:
@@ -92,7 +96,7 @@ class TestBlack76PutPrice:
     def test_put_price_itm(self) -> None:
         """Test put price for in-the-money futures option."""
         price = black76.put_price(f=90.0, k=100.0, t=1.0, r=0.05, sigma=0.2)
-        intrinsic = (100.0 - 90.0) * math.exp(-0.05 * 1.0)
+        intrinsic = (100.0 - 90.0) * RATE_DISCOUNT_1Y
         assert price > intrinsic
 
     def test_put_price_otm(self) -> None:
@@ -104,7 +108,7 @@ class TestBlack76PutPrice:
     def test_put_price_deep_itm(self) -> None:
         """Test put price for deep in-the-money futures option."""
         price = black76.put_price(f=50.0, k=100.0, t=1.0, r=0.05, sigma=0.2)
-        intrinsic = (100.0 - 50.0) * math.exp(-0.05 * 1.0)
+        intrinsic = (100.0 - 50.0) * RATE_DISCOUNT_1Y
         assert abs(price - intrinsic) < 1.0
 
     def test_put_price_deep_otm(self) -> None:
@@ -194,14 +198,10 @@ class TestBlack76Batch:
         call_batch = black76.call_price_batch(forwards, strikes, times, rates, sigmas)
         put_batch = black76.put_price_batch(forwards, strikes, times, rates, sigmas)
 
-        call_batch_list = arrow.to_list(call_batch)
-        put_batch_list = arrow.to_list(put_batch)
-
-        for i, forward in enumerate(forwards):
-            call_single = black76.call_price(f=forward, k=100.0, t=1.0, r=0.05, sigma=0.2)
-            put_single = black76.put_price(f=forward, k=100.0, t=1.0, r=0.05, sigma=0.2)
-            assert abs(call_batch_list[i] - call_single) < THEORETICAL_TOLERANCE
-            assert abs(put_batch_list[i] - put_single) < THEORETICAL_TOLERANCE
+        call_single = [black76.call_price(f=forward, k=100.0, t=1.0, r=0.05, sigma=0.2) for forward in forwards]
+        put_single = [black76.put_price(f=forward, k=100.0, t=1.0, r=0.05, sigma=0.2) for forward in forwards]
+        np.testing.assert_allclose(to_numpy_array(call_batch), call_single, atol=THEORETICAL_TOLERANCE)
+        np.testing.assert_allclose(to_numpy_array(put_batch), put_single, atol=THEORETICAL_TOLERANCE)
 
     def test_batch_with_invalid_forwards(self) -> None:
         """Test batch processing with invalid forwards."""
@@ -353,7 +353,7 @@ class TestBlack76ImpliedVolatility:
         """Test batch implied volatility calculation."""
         # Create prices with known volatilities
         sigmas = np.array([0.2, 0.25, 0.3])
-        prices = np.array([black76.call_price(f=100.0, k=100.0, t=1.0, r=0.05, sigma=sig) for sig in sigmas])
+        prices = black76.call_price_batch(100.0, 100.0, 1.0, 0.05, sigmas)
 
         forwards = np.array([100.0, 100.0, 100.0])
         strikes = np.array([100.0, 100.0, 100.0])
@@ -363,9 +363,7 @@ class TestBlack76ImpliedVolatility:
         ivs = black76.implied_volatility_batch(prices, forwards, strikes, times, rates, True)
 
         assert len(ivs) == 3
-        ivs_list = arrow.to_list(ivs)
-        for _i, (iv, true_sigma) in enumerate(zip(ivs_list, sigmas, strict=False)):
-            assert abs(iv - true_sigma) < THEORETICAL_TOLERANCE
+        np.testing.assert_allclose(to_numpy_array(ivs), sigmas, atol=THEORETICAL_TOLERANCE)
 
     def test_implied_volatility_invalid_price(self) -> None:
         """Test implied volatility with invalid price."""
@@ -385,22 +383,19 @@ class TestBlack76Properties:
         """Test call price increases with forward."""
         forwards = np.linspace(80, 120, 10)
         prices = [black76.call_price(f=f, k=100.0, t=1.0, r=0.05, sigma=0.2) for f in forwards]
-        for i in range(len(prices) - 1):
-            assert prices[i] < prices[i + 1]
+        assert np.all(np.diff(prices) > 0), f"Call prices not increasing in forward: {prices}"
 
     def test_put_price_monotonicity_forward(self) -> None:
         """Test put price decreases with forward."""
         forwards = np.linspace(80, 120, 10)
         prices = [black76.put_price(f=f, k=100.0, t=1.0, r=0.05, sigma=0.2) for f in forwards]
-        for i in range(len(prices) - 1):
-            assert prices[i] > prices[i + 1]
+        assert np.all(np.diff(prices) < 0), f"Put prices not decreasing in forward: {prices}"
 
     def test_call_price_monotonicity_volatility(self) -> None:
         """Test call price increases with volatility."""
         sigmas = np.linspace(0.1, 0.5, 10)
         prices = [black76.call_price(f=100.0, k=100.0, t=1.0, r=0.05, sigma=sig) for sig in sigmas]
-        for i in range(len(prices) - 1):
-            assert prices[i] < prices[i + 1]
+        assert np.all(np.diff(prices) > 0), f"Call prices not increasing in volatility: {prices}"
 
     def test_price_bounds(self) -> None:
         """Test futures option prices respect arbitrage bounds."""
@@ -421,8 +416,7 @@ class TestBlack76Properties:
         times = [2.0, 1.5, 1.0, 0.5, 0.1]
         call_prices = [black76.call_price(f=100.0, k=100.0, t=t, r=0.05, sigma=0.2) for t in times]
         # ATM options should decrease in value as expiration approaches
-        for i in range(len(call_prices) - 1):
-            assert call_prices[i] > call_prices[i + 1]
+        assert np.all(np.diff(call_prices) < 0), f"Call prices not decaying with time: {call_prices}"
 
 
 class TestBlack76EdgeCases:
@@ -459,7 +453,7 @@ class TestBlack76EdgeCases:
         """Test extreme in and out of the money calls."""
         # Very deep ITM
         deep_itm = black76.call_price(f=1000.0, k=100.0, t=1.0, r=0.05, sigma=0.2)
-        assert abs(deep_itm - (1000.0 - 100.0) * math.exp(-0.05)) < 1.0
+        assert abs(deep_itm - (1000.0 - 100.0) * RATE_DISCOUNT_1Y) < 1.0
 
         # Very deep OTM
         deep_otm = black76.call_price(f=1.0, k=100.0, t=1.0, r=0.05, sigma=0.2)
@@ -469,7 +463,7 @@ class TestBlack76EdgeCases:
         """Test extreme in and out of the money puts."""
         # Very deep ITM
         deep_itm = black76.put_price(f=1.0, k=100.0, t=1.0, r=0.05, sigma=0.2)
-        assert abs(deep_itm - (100.0 - 1.0) * math.exp(-0.05)) < 1.0
+        assert abs(deep_itm - (100.0 - 1.0) * RATE_DISCOUNT_1Y) < 1.0
 
         # Very deep OTM
         deep_otm = black76.put_price(f=1000.0, k=100.0, t=1.0, r=0.05, sigma=0.2)
@@ -483,8 +477,7 @@ class TestBlack76NumericalStability:
         """Test with very large forward prices."""
         call = black76.call_price(f=10000.0, k=100.0, t=1.0, r=0.05, sigma=0.2)
         assert math.isfinite(call)
-        discount = math.exp(-0.05)
-        assert call > (10000.0 - 100.0) * discount * 0.9  # Close to intrinsic
+        assert call > (10000.0 - 100.0) * RATE_DISCOUNT_1Y * 0.9  # Close to intrinsic
 
     def test_small_forward_values(self) -> None:
         """Test with very small forward prices."""
@@ -6,20 +6,34 @@ import numpy as np
 import pytest
 from quantforge.models import black_scholes
 
+from tests.base_testing import to_numpy_array
 from tests.conftest import (
     INPUT_ARRAY_TYPES,
+    NUMERICAL_TOLERANCE,
     THEORETICAL_TOLERANCE,
     arrow,
     create_test_array,
 )
 
+# Discount factor for the standard parameters (r=0.05, t=1.0)
+RATE_DISCOUNT_1Y = math.exp(-0.05 * 1.0)
+
+
+@pytest.fixture(scope="module")
+def atm_price_pair() -> tuple[float, float]:
+    """ATM call and put prices shared by the price and scale-consistency tests."""
+    return (
+        black_scholes.call_price(s=100.0, k=100.0, t=1.0, r=0.05, sigma=0.2),
+        black_scholes.put_price(s=100.0, k=100.0, t=1.0, r=0.05, sigma=0.2),
+    )
+
 
 class TestBlackScholesCallPrice:
     """Test Black-Scholes call price calculation."""
 
-    def test_call_price_atm(self) -> None:
+    def test_call_price_atm(self, atm_price_pair: tuple[float, float]) -> None:
         """Test call price for at-the-money option."""
-        price = black_scholes.call_price(s=100.0, k=100.0, t=1.0, r=0.05, sigma=0.2)
+        price, _ = atm_price_pair
         assert price > 0
         assert price < 100.0  # Call price must be less than spot
         # ATM call with these parameters should be around 10.45
@@ -28,7 +42,7 @@ class TestBlackScholesCallPrice:
     def test_call_price_itm(self) -> None:
         """Test call price for in-the-money option."""
         price = black_scholes.call_price(s=110.0, k=100.0, t=1.0, r=0.05, sigma=0.2)
-        intrinsic = 110.0 - 100.0 * math.exp(-0.05 * 1.0)
+        intrinsic = 110.0 - 100.0 * RATE_DISCOUNT_1Y
         assert price > intrinsic  # Must be worth at least intrinsic value
         assert price < 110.0  # But less than spot
 
@@ -41,7 +55,7 @@ class TestBlackScholesCallPrice:
     def test_call_price_deep_itm(self) -> None:
         """Test call price for deep in-the-money option."""
         price = black_scholes.call_price(s=200.0, k=100.0, t=1.0, r=0.05, sigma=0.2)
-        intrinsic = 200.0 - 100.0 * math.exp(-0.05 * 1.0)
+        intrinsic = 200.0 - 100.0 * RATE_DISCOUNT_1Y
         assert abs(price - intrinsic) < 1.0  # Should be close to intrinsic
 
     def test_call_price_deep_otm(self) -> None:
@@ -88,9 +102,9 @@ class TestBlackScholesCallPrice:
 class TestBlackScholesPutPrice:
     """Test Black-Scholes put price calculation."""
 
-    def test_put_price_atm(self) -> None:
+    def test_put_price_atm(self, atm_price_pair: tuple[float, float]) -> None:
         """Test put price for at-the-money option."""
-        price = black_scholes.put_price(s=100.0, k=100.0, t=1.0, r=0.05, sigma=0.2)
+        _, price = atm_price_pair
         assert price > 0
         assert price < 100.0
         # ATM put with these parameters should be around 5.57
@@ -99,7 +113,7 @@ class TestBlackScholesPutPrice:
     def test_put_price_itm(self) -> None:
         """Test put price for in-the-money option."""
         price = black_scholes.put_price(s=90.0, k=100.0, t=1.0, r=0.05, sigma=0.2)
-        intrinsic = 100.0 * math.exp(-0.05 * 1.0) - 90.0
+        intrinsic = 100.0 * RATE_DISCOUNT_1Y - 90.0
         assert price > intrinsic
 
     def test_put_price_otm(self) -> None:
@@ -111,7 +125,7 @@ class TestBlackScholesPutPrice:
     def test_put_price_deep_itm(self) -> None:
         """Test put price for deep in-the-money option."""
         price = black_scholes.put_price(s=50.0, k=100.0, t=1.0, r=0.05, sigma=0.2)
-        intrinsic = 100.0 * math.exp(-0.05 * 1.0) - 50.0
+        intrinsic = 100.0 * RATE_DISCOUNT_1Y - 50.0
         assert abs(price - intrinsic) < 1.0
 
     def test_put_price_deep_otm(self) -> None:
@@ -121,6 +135,7 @@ class TestBlackScholesPutPrice:
 
     def test_put_call_parity(self) -> None:
         """Test put-call parity relationship."""
+        # Off-ATM strike so that swapped s/k in the pricer cannot cancel out
         s, k, t, r, sigma = 100.0, 95.0, 1.0, 0.05, 0.2
         call = black_scholes.call_price(s, k, t, r, sigma)
         put = black_scholes.put_price(s, k, t, r, sigma)
@@ -206,11 +221,10 @@ class TestBlackScholesBatch:
         arrow.assert_type(call_batch)
         arrow.assert_type(put_batch)
 
-        for i, spot in enumerate(spots_np):
-            call_single = black_scholes.call_price(s=spot, k=100.0, t=1.0, r=0.05, sigma=0.2)
-            put_single = black_scholes.put_price(s=spot, k=100.0, t=1.0, r=0.05, sigma=0.2)
-            assert abs(arrow.get_value(call_batch, i) - call_single) < THEORETICAL_TOLERANCE
-            assert abs(arrow.get_value(put_batch, i) - put_single) < THEORETICAL_TOLERANCE
+        call_single = [black_scholes.call_price(s=spot, k=100.0, t=1.0, r=0.05, sigma=0.2) for spot in spots_np]
+        put_single = [black_scholes.put_price(s=spot, k=100.0, t=1.0, r=0.05, sigma=0.2) for spot in spots_np]
+        np.testing.assert_allclose(to_numpy_array(call_batch), call_single, atol=THEORETICAL_TOLERANCE)
+        np.testing.assert_allclose(to_numpy_array(put_batch), put_single, atol=THEORETICAL_TOLERANCE)
 
 
 class TestBlackScholesGreeks:
@@ -307,15 +321,14 @@ class TestBlackScholesImpliedVolatility:
 
         assert abs(iv - true_sigma) < THEORETICAL_TOLERANCE
 
-    def test_implied_volatility_with_guess(self) -> None:
-        """Test implied volatility calculation."""
-        true_sigma = 0.4
-        price = black_scholes.call_price(s=100.0, k=100.0, t=1.0, r=0.05, sigma=true_sigma)
+    def test_implied_volatility_recovery_batch(self) -> None:
+        """Test batch implied volatility recovers a range of volatilities."""
+        true_sigmas = np.array([0.15, 0.25, 0.35, 0.45])
+        prices = black_scholes.call_price_batch(100.0, 100.0, 1.0, 0.05, true_sigmas)
 
-        # API doesn't support initial_guess parameter
-        iv = black_scholes.implied_volatility(price=price, s=100.0, k=100.0, t=1.0, r=0.05, is_call=True)
+        ivs = black_scholes.implied_volatility_batch(prices, 100.0, 100.0, 1.0, 0.05, True)
 
-        assert abs(iv - true_sigma) < THEORETICAL_TOLERANCE
+        np.testing.assert_allclose(to_numpy_array(ivs), true_sigmas, atol=NUMERICAL_TOLERANCE)
 
     def test_implied_volatility_extreme_price(self) -> None:
         """Test implied volatility with extreme prices."""
@@ -345,23 +358,20 @@ class TestBlackScholesProperties:
     def test_call_price_monotonicity_spot(self) -> None:
         """Test call price increases with spot."""
         spots = np.linspace(80, 120, 10)
-        prices = [black_scholes.call_price(s=s, k=100.0, t=1.0, r=0.05, sigma=0.2) for s in spots]
-        for i in range(len(prices) - 1):
-            assert prices[i] < prices[i + 1]
+        prices = to_numpy_array(black_scholes.call_price_batch(spots, 100.0, 1.0, 0.05, 0.2))
+        assert np.all(np.diff(prices) > 0), f"Call prices not increasing in spot: {prices}"
 
     def test_put_price_monotonicity_spot(self) -> None:
         """Test put price decreases with spot."""
         spots = np.linspace(80, 120, 10)
-        prices = [black_scholes.put_price(s=s, k=100.0, t=1.0, r=0.05, sigma=0.2) for s in spots]
-        for i in range(len(prices) - 1):
-            assert prices[i] > prices[i + 1]
+        prices = to_numpy_array(black_scholes.put_price_batch(spots, 100.0, 1.0, 0.05, 0.2))
+        assert np.all(np.diff(prices) < 0), f"Put prices not decreasing in spot: {prices}"
 
     def test_call_price_monotonicity_volatility(self) -> None:
         """Test call price increases with volatility."""
         sigmas = np.linspace(0.1, 0.5, 10)
-        prices = [black_scholes.call_price(s=100.0, k=100.0, t=1.0, r=0.05, sigma=sig) for sig in sigmas]
-        for i in range(len(prices) - 1):
-            assert prices[i] < prices[i + 1]
+        prices = to_numpy_array(black_scholes.call_price_batch(100.0, 100.0, 1.0, 0.05, sigmas))
+        assert np.all(np.diff(prices) > 0), f"Call prices not increasing in volatility: {prices}"
 
     def test_price_bounds(self) -> None:
         """Test option prices respect arbitrage bounds."""
@@ -378,11 +388,10 @@ class TestBlackScholesProperties:
 
     def test_time_decay(self) -> None:
         """Test options lose value as time decreases (theta effect)."""
-        times = [2.0, 1.5, 1.0, 0.5, 0.1]
-        call_prices = [black_scholes.call_price(s=100.0, k=100.0, t=t, r=0.05, sigma=0.2) for t in times]
+        times = np.array([2.0, 1.5, 1.0, 0.5, 0.1])
+        call_prices = to_numpy_array(black_scholes.call_price_batch(100.0, 100.0, times, 0.05, 0.2))
         # ATM options should decrease in value as expiration approaches
-        for i in range(len(call_prices) - 1):
-            assert call_prices[i] > call_prices[i + 1]
+        assert np.all(np.diff(call_prices) < 0), f"Call prices not decaying with time: {call_prices}"
 
 
 class TestBlackScholesEdgeCases:
@@ -402,35 +411,30 @@ class TestBlackScholesEdgeCases:
         assert call > 20.0
         assert call < 100.0
 
-    def test_very_low_volatility(self) -> None:
-        """Test with very low but non-zero volatility."""
-        # Use minimum allowed volatility (0.005 based on validation)
-        call = black_scholes.call_price(s=100.0, k=100.0, t=1.0, r=0.05, sigma=0.005)
-        # Should be close to intrinsic value
-        intrinsic = max(100.0 - 100.0 * math.exp(-0.05), 0)
-        assert abs(call - intrinsic) < 1.0
-
-    def test_very_high_volatility(self) -> None:
-        """Test with very high volatility."""
-        call = black_scholes.call_price(s=100.0, k=100.0, t=1.0, r=0.05, sigma=2.0)
-        # High volatility means high option value
-        assert call > 30.0
-
-    def test_extreme_moneyness_call(self) -> None:
-        """Test extreme in and out of the money calls."""
-        # Very deep ITM
-        deep_itm = black_scholes.call_price(s=1000.0, k=100.0, t=1.0, r=0.05, sigma=0.2)
-        assert abs(deep_itm - (1000.0 - 100.0 * math.exp(-0.05))) < 1.0
+    def test_boundary_cases_batch(self) -> None:
+        """Test low/high volatility and extreme moneyness calls in one batch."""
+        # All cases share K=100, T=1, r=0.05 and differ only in (spot, sigma)
+        cases = ["very_low_volatility", "very_high_volatility", "deep_itm", "deep_otm"]
+        spots = np.array([100.0, 100.0, 1000.0, 1.0])
+        sigmas = np.array([0.005, 2.0, 0.2, 0.2])
 
-        # Very deep OTM
-        deep_otm = black_scholes.call_price(s=1.0, k=100.0, t=1.0, r=0.05, sigma=0.2)
-        assert deep_otm < 0.0001
+        # Expected bounds per case (lower, upper)
+        atm_forward_intrinsic = 100.0 - 100.0 * RATE_DISCOUNT_1Y
+        deep_itm_intrinsic = 1000.0 - 100.0 * RATE_DISCOUNT_1Y
+        lower = np.array([atm_forward_intrinsic - 1.0, 30.0, deep_itm_intrinsic - 1.0, -np.inf])
+        upper = np.array([atm_forward_intrinsic + 1.0, np.inf, deep_itm_intrinsic + 1.0, 0.0001])
+
+        calls = to_numpy_array(black_scholes.call_price_batch(spots, 100.0, 1.0, 0.05, sigmas))
+
+        in_bounds = (calls > lower) & (calls < upper)
+        failed = [f"{case}={call}" for case, call, ok in zip(cases, calls, in_bounds, strict=True) if not ok]
+        assert in_bounds.all(), f"Boundary cases out of range: {failed}"
 
     def test_extreme_moneyness_put(self) -> None:
         """Test extreme in and out of the money puts."""
         # Very deep ITM
         deep_itm = black_scholes.put_price(s=1.0, k=100.0, t=1.0, r=0.05, sigma=0.2)
-        assert abs(deep_itm - (100.0 * math.exp(-0.05) - 1.0)) < 1.0
+        assert abs(deep_itm - (100.0 * RATE_DISCOUNT_1Y - 1.0)) < 1.0
 
         # Very deep OTM
         deep_otm = black_scholes.put_price(s=1000.0, k=100.0, t=1.0, r=0.05, sigma=0.2)
@@ -460,10 +464,16 @@ class TestBlackScholesNumericalStability:
         low_rate_call = black_scholes.call_price(s=100.0, k=100.0, t=1.0, r=0.01, sigma=0.2)
         assert call > low_rate_call
 
-    def test_consistency_across_scales(self) -> None:
+    def test_consistency_across_scales(self, atm_price_pair: tuple[float, float]) -> None:
         """Test scaling property of Black-Scholes."""
-        # Scaling spot and strike by same factor shouldn't change relative price
-        price1 = black_scholes.call_price(s=100.0, k=100.0, t=1.0, r=0.05, sigma=0.2)
-        price2 = black_scholes.call_price(s=1000.0, k=1000.0, t=1.0, r=0.05, sigma=0.2)
+        # Scaling spot and strike by the same factor scales the price by that factor
+        base_call, base_put = atm_price_pair
+        multipliers = np.array([0.5, 1.0, 2.0, 10.0])
+        spots = 100.0 * multipliers
+        strikes = 100.0 * multipliers
+
+        scaled_calls = to_numpy_array(black_scholes.call_price_batch(spots, strikes, 1.0, 0.05, 0.2))
+        scaled_puts = to_numpy_array(black_scholes.put_price_batch(spots, strikes, 1.0, 0.05, 0.2))
 
-        assert abs(price1 / 100.0 - price2 / 1000.0) < THEORETICAL_TOLERANCE
+        np.testing.assert_allclose(scaled_calls / multipliers, base_call, atol=THEORETICAL_TOLERANCE)
+        np.testing.assert_allclose(scaled_puts / multipliers, base_put, atol=THEORETICAL_TOLERANCE)
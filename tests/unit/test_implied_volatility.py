@@ -190,18 +190,18 @@ class TestImpliedVolatility:
 
     def test_iv_convergence_rate(self) -> None:
         """収束率のテスト（100件のランダムケース）"""
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
         n_tests = 100
         converged = 0
 
         for _ in range(n_tests):
             # ランダムパラメータ
-            s = np.random.uniform(50, 150)
-            k = np.random.uniform(50, 150)
-            t = np.random.uniform(0.1, 2.0)
-            r = np.random.uniform(0.0, 0.1)
-            vol = np.random.uniform(0.1, 0.5)
-            is_call = np.random.choice([True, False])
+            s = rng.uniform(50, 150)
+            k = rng.uniform(50, 150)
+            t = rng.uniform(0.1, 2.0)
+            r = rng.uniform(0.0, 0.1)
+            vol = rng.uniform(0.1, 0.5)
+            is_call = rng.choice([True, False])
 
             # 価格計算
             price = black_scholes.call_price(s, k, t, r, vol) if is_call else black_scholes.put_price(s, k, t, r, vol)
@@ -228,15 +228,15 @@ class TestImpliedVolatility:
         """大規模バッチ処理のパフォーマンステスト"""
         # 10,000件のデータ
         n = 10000
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
 
         # ランダムデータ生成
-        spots = np.random.uniform(80, 120, n)
-        strikes = np.random.uniform(80, 120, n)
-        times = np.random.uniform(0.1, 2.0, n)
-        rates = np.random.uniform(0.0, 0.1, n)
-        vols = np.random.uniform(0.15, 0.35, n)
-        is_calls = np.random.choice([True, False], n)
+        spots = rng.uniform(80, 120, n)
+        strikes = rng.uniform(80, 120, n)
+        times = rng.uniform(0.1, 2.0, n)
+        rates = rng.uniform(0.0, 0.1, n)
+        vols = rng.uniform(0.15, 0.35, n)
+        is_calls = rng.choice([True, False], n)
 
         # 価格を計算
         prices = np.zeros(n)
@@ -269,7 +269,6 @@ class TestImpliedVolatility:
         assert len(valid_ivs) > n_test * 0.90  # 90%以上成功
         assert elapsed < 1.0  # 1秒以内に完了
 
-        # 精度検証
-        for i in range(n_test):
-            if not np.isnan(ivs[i]) and ivs[i] > 0.01:
-                assert abs(ivs[i] - vols[i]) < 0.01  # 1%の誤差を許容
+        # 精度検証（収束した解のみ、1%の誤差を許容）
+        converged = ~np.isnan(ivs) & (ivs > 0.01)
+        np.testing.assert_allclose(ivs[converged], vols[:n_test][converged], atol=0.01)
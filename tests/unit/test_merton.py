@@ -1,11 +1,13 @@
 """Comprehensive unit tests for Merton model module (with dividends)."""
 
 import math
+from typing import Any
 
 import numpy as np
 import pytest
-from quantforge.models import merton
+from quantforge.models import black_scholes, merton
 
+from tests.base_testing import to_numpy_array
 from tests.conftest import (
     INPUT_ARRAY_TYPES,
     THEORETICAL_TOLERANCE,
@@ -13,17 +15,40 @@ from tests.conftest import (
     create_test_array,
 )
 
+# Discount factors for the standard parameters (r=0.05, q=0.02, t=1.0)
+RATE_DISCOUNT_1Y = math.exp(-0.05 * 1.0)
+DIVIDEND_DISCOUNT_1Y = math.exp(-0.02 * 1.0)
+
+
+@pytest.fixture(scope="module")
+def atm_merton_greeks() -> dict[str, dict[str, float]]:
+    """ATM call and put Greeks with dividend, computed once per module."""
+    return {
+        "call": merton.greeks(s=100.0, k=100.0, t=1.0, r=0.05, q=0.02, sigma=0.2, is_call=True),
+        "put": merton.greeks(s=100.0, k=100.0, t=1.0, r=0.05, q=0.02, sigma=0.2, is_call=False),
+    }
+
+
+@pytest.fixture(scope="module")
+def bs_reference() -> dict[str, Any]:
+    """Black-Scholes ATM reference values that Merton must reproduce when q=0."""
+    return {
+        "call": black_scholes.call_price(s=100.0, k=100.0, t=1.0, r=0.05, sigma=0.2),
+        "put": black_scholes.put_price(s=100.0, k=100.0, t=1.0, r=0.05, sigma=0.2),
+        "greeks": black_scholes.greeks(s=100.0, k=100.0, t=1.0, r=0.05, sigma=0.2, is_call=True),
+    }
+
 
 class TestMertonCallPrice:
     """Test Merton call price calculation with dividend yield."""
 
-    def test_call_price_atm_no_dividend(self) -> None:
+    def test_call_price_atm_no_dividend(self, bs_reference: dict[str, Any]) -> None:
         """Test call price for at-the-money option with no dividend."""
         price = merton.call_price(s=100.0, k=100.0, t=1.0, r=0.05, q=0.0, sigma=0.2)
         assert price > 0
         assert price < 100.0
         # Should match Black-Scholes when q=0
-        assert abs(price - 10.45) < 0.5
+        assert abs(price - bs_reference["call"]) < THEORETICAL_TOLERANCE
 
     def test_call_price_atm_with_dividend(self) -> None:
         """Test call price for at-the-money option with dividend."""
@@ -37,8 +62,8 @@ class TestMertonCallPrice:
         """Test call price for in-the-money option with dividend."""
         price = merton.call_price(s=110.0, k=100.0, t=1.0, r=0.05, q=0.02, sigma=0.2)
         # Adjusted intrinsic value with dividend
-        adj_spot = 110.0 * math.exp(-0.02 * 1.0)
-        intrinsic = adj_spot - 100.0 * math.exp(-0.05 * 1.0)
+        adj_spot = 110.0 * DIVIDEND_DISCOUNT_1Y
+        intrinsic = adj_spot - 100.0 * RATE_DISCOUNT_1Y
         assert price > max(intrinsic, 0)
 
     def test_call_price_otm(self) -> None:
@@ -50,8 +75,8 @@ class TestMertonCallPrice:
     def test_call_price_deep_itm(self) -> None:
         """Test call price for deep in-the-money option with dividend."""
         price = merton.call_price(s=200.0, k=100.0, t=1.0, r=0.05, q=0.02, sigma=0.2)
-        adj_spot = 200.0 * math.exp(-0.02 * 1.0)
-        intrinsic = adj_spot - 100.0 * math.exp(-0.05 * 1.0)
+        adj_spot = 200.0 * DIVIDEND_DISCOUNT_1Y
+        intrinsic = adj_spot - 100.0 * RATE_DISCOUNT_1Y
         assert abs(price - intrinsic) < 1.0
 
     def test_call_price_deep_otm(self) -> None:
@@ -86,27 +111,16 @@ class TestMertonCallPrice:
         price = merton.call_price(s=100.0, k=100.0, t=1.0, r=-0.02, q=0.01, sigma=0.2)
         assert price > 0
 
-    def test_call_price_invalid_inputs(self) -> None:
-        """Test call price with invalid inputs."""
-        with pytest.raises(ValueError):
-            merton.call_price(s=-100.0, k=100.0, t=1.0, r=0.05, q=0.02, sigma=0.2)
-
-        with pytest.raises(ValueError):
-            merton.call_price(s=100.0, k=-100.0, t=1.0, r=0.05, q=0.02, sigma=0.2)
-
-        with pytest.raises(ValueError):
-            merton.call_price(s=100.0, k=100.0, t=-1.0, r=0.05, q=0.02, sigma=0.2)
-
 
 class TestMertonPutPrice:
     """Test Merton put price calculation with dividend yield."""
 
-    def test_put_price_atm_no_dividend(self) -> None:
+    def test_put_price_atm_no_dividend(self, bs_reference: dict[str, Any]) -> None:
         """Test put price for at-the-money option with no dividend."""
         price = merton.put_price(s=100.0, k=100.0, t=1.0, r=0.05, q=0.0, sigma=0.2)
         assert price > 0
         # Should match Black-Scholes when q=0
-        assert abs(price - 5.57) < 0.5
+        assert abs(price - bs_reference["put"]) < THEORETICAL_TOLERANCE
 
     def test_put_price_atm_with_dividend(self) -> None:
         """Test put price for at-the-money option with dividend."""
@@ -119,8 +133,8 @@ class TestMertonPutPrice:
     def test_put_price_itm(self) -> None:
         """Test put price for in-the-money option with dividend."""
         price = merton.put_price(s=90.0, k=100.0, t=1.0, r=0.05, q=0.02, sigma=0.2)
-        adj_spot = 90.0 * math.exp(-0.02 * 1.0)
-        intrinsic = 100.0 * math.exp(-0.05 * 1.0) - adj_spot
+        adj_spot = 90.0 * DIVIDEND_DISCOUNT_1Y
+        intrinsic = 100.0 * RATE_DISCOUNT_1Y - adj_spot
         assert price > max(intrinsic, 0)
 
     def test_put_price_otm(self) -> None:
@@ -132,8 +146,8 @@ class TestMertonPutPrice:
     def test_put_price_deep_itm(self) -> None:
         """Test put price for deep in-the-money option with dividend."""
         price = merton.put_price(s=50.0, k=100.0, t=1.0, r=0.05, q=0.02, sigma=0.2)
-        adj_spot = 50.0 * math.exp(-0.02 * 1.0)
-        intrinsic = 100.0 * math.exp(-0.05 * 1.0) - adj_spot
+        adj_spot = 50.0 * DIVIDEND_DISCOUNT_1Y
+        intrinsic = 100.0 * RATE_DISCOUNT_1Y - adj_spot
         assert abs(price - intrinsic) < 1.0
 
     def test_put_price_deep_otm(self) -> None:
@@ -153,6 +167,28 @@ class TestMertonPutPrice:
         assert abs(lhs - rhs) < THEORETICAL_TOLERANCE
 
 
+class TestMertonValidation:
+    """Test input validation of Merton pricing functions."""
+
+    @pytest.mark.parametrize(
+        "price_fn,args",
+        [
+            (merton.call_price, (-100.0, 100.0, 1.0, 0.05, 0.02, 0.2)),
+            (merton.call_price, (100.0, -100.0, 1.0, 0.05, 0.02, 0.2)),
+            (merton.call_price, (100.0, 100.0, -1.0, 0.05, 0.02, 0.2)),
+            (merton.call_price, (100.0, 100.0, 1.0, 0.05, 0.02, -0.2)),
+            (merton.put_price, (100.0, -100.0, 1.0, 0.05, 0.02, 0.2)),
+            (merton.call_price, (math.inf, 100.0, 1.0, 0.05, 0.02, 0.2)),
+            (merton.put_price, (100.0, 100.0, 1.0, math.inf, 0.02, 0.2)),
+        ],
+        ids=["neg_spot", "neg_strike", "neg_time", "neg_vol", "put_neg_strike", "inf_spot", "put_inf_rate"],
+    )
+    def test_invalid_inputs(self, price_fn: Any, args: tuple[float, ...]) -> None:
+        """Test pricing functions reject invalid inputs."""
+        with pytest.raises(ValueError):
+            price_fn(*args)
+
+
 class TestMertonBatch:
     """Test Merton batch processing with dividends."""
 
@@ -220,7 +256,7 @@ class TestMertonBatch:
 
     @pytest.mark.parametrize("array_type", INPUT_ARRAY_TYPES)
     def test_batch_consistency(self, array_type: str) -> None:
-        """Test batch results match individual calculations."""
+        """Test batch results satisfy put-call parity and spot monotonicity."""
         spots_np = np.linspace(80, 120, 10)
         n = len(spots_np)
         spots = create_test_array(spots_np.tolist(), array_type)
@@ -235,36 +271,50 @@ class TestMertonBatch:
 
         arrow.assert_type(call_batch)
         arrow.assert_type(put_batch)
-        call_batch_list = arrow.to_list(call_batch)
-        put_batch_list = arrow.to_list(put_batch)
+        calls = to_numpy_array(call_batch)
+        puts = to_numpy_array(put_batch)
 
-        for i, spot in enumerate(spots_np):
-            call_single = merton.call_price(s=spot, k=100.0, t=1.0, r=0.05, q=0.02, sigma=0.2)
-            put_single = merton.put_price(s=spot, k=100.0, t=1.0, r=0.05, q=0.02, sigma=0.2)
-            assert abs(call_batch_list[i] - call_single) < THEORETICAL_TOLERANCE
-            assert abs(put_batch_list[i] - put_single) < THEORETICAL_TOLERANCE
+        # Put-Call Parity with dividends: C - P = S*exp(-q*t) - K*exp(-r*t)
+        np.testing.assert_allclose(
+            calls - puts,
+            spots_np * DIVIDEND_DISCOUNT_1Y - 100.0 * RATE_DISCOUNT_1Y,
+            atol=THEORETICAL_TOLERANCE,
+        )
+        assert np.all(np.diff(calls) > 0), "Call prices should increase with spot"
+        assert np.all(np.diff(puts) < 0), "Put prices should decrease with spot"
 
     @pytest.mark.parametrize("array_type", INPUT_ARRAY_TYPES)
-    def test_batch_with_varying_dividends(self, array_type: str) -> None:
-        """Test batch processing with varying dividend yields."""
+    def test_batch_with_varying_dividends(self, array_type: str, bs_reference: dict[str, Any]) -> None:
+        """Test parity, Black-Scholes reduction and dividend effect on one dividend grid."""
+        divs_np = np.array([0.0, 0.02, 0.05])  # Varying dividends
         spots = create_test_array([100.0, 100.0, 100.0], array_type)
         strikes = create_test_array([100.0, 100.0, 100.0], array_type)
         times = create_test_array([1.0, 1.0, 1.0], array_type)
         rates = create_test_array([0.05, 0.05, 0.05], array_type)
-        divs = create_test_array([0.0, 0.02, 0.05], array_type)  # Varying dividends
+        divs = create_test_array(divs_np.tolist(), array_type)
         sigmas = create_test_array([0.2, 0.2, 0.2], array_type)
 
         call_prices = merton.call_price_batch(spots, strikes, times, rates, divs, sigmas)
-        arrow.assert_type(call_prices)
-        call_prices_list = arrow.to_list(call_prices)
-        # Higher dividend should reduce call value
-        assert call_prices_list[0] > call_prices_list[1] > call_prices_list[2]
-
         put_prices = merton.put_price_batch(spots, strikes, times, rates, divs, sigmas)
+        arrow.assert_type(call_prices)
         arrow.assert_type(put_prices)
-        put_prices_list = arrow.to_list(put_prices)
-        # Higher dividend should increase put value
-        assert put_prices_list[0] < put_prices_list[1] < put_prices_list[2]
+        calls = to_numpy_array(call_prices)
+        puts = to_numpy_array(put_prices)
+
+        # Put-Call Parity with dividends: C - P = S*exp(-q*t) - K*exp(-r*t)
+        np.testing.assert_allclose(
+            calls - puts,
+            100.0 * np.exp(-divs_np * 1.0) - 100.0 * RATE_DISCOUNT_1Y,
+            atol=THEORETICAL_TOLERANCE,
+        )
+
+        # Should match standard Black-Scholes values when q=0
+        assert abs(calls[0] - bs_reference["call"]) < THEORETICAL_TOLERANCE
+        assert abs(puts[0] - bs_reference["put"]) < THEORETICAL_TOLERANCE
+
+        # Higher dividend should reduce call value and increase put value
+        assert np.all(np.diff(calls) < 0)
+        assert np.all(np.diff(puts) > 0)
 
     @pytest.mark.parametrize("array_type", INPUT_ARRAY_TYPES)
     def test_empty_batch(self, array_type: str) -> None:
@@ -284,12 +334,12 @@ class TestMertonBatch:
 class TestMertonGreeks:
     """Test Merton Greeks calculation with dividends."""
 
-    def test_greeks_call(self) -> None:
+    def test_greeks_call(self, atm_merton_greeks: dict[str, dict[str, float]]) -> None:
         """Test Greeks for call option with dividend."""
-        greeks = merton.greeks(s=100.0, k=100.0, t=1.0, r=0.05, q=0.02, sigma=0.2, is_call=True)
+        greeks = atm_merton_greeks["call"]
 
-        # Delta should be between 0 and 1 for calls
-        assert 0 < greeks["delta"] < 1
+        # Delta should be between 0 and exp(-q*t) for calls
+        assert 0 < greeks["delta"] < DIVIDEND_DISCOUNT_1Y
 
         # Gamma should be positive
         assert greeks["gamma"] > 0
@@ -307,12 +357,12 @@ class TestMertonGreeks:
         assert "dividend_rho" in greeks
         assert greeks["dividend_rho"] < 0
 
-    def test_greeks_put(self) -> None:
+    def test_greeks_put(self, atm_merton_greeks: dict[str, dict[str, float]]) -> None:
         """Test Greeks for put option with dividend."""
-        greeks = merton.greeks(s=100.0, k=100.0, t=1.0, r=0.05, q=0.02, sigma=0.2, is_call=False)
+        greeks = atm_merton_greeks["put"]
 
-        # Delta should be between -1 and 0 for puts
-        assert -1 < greeks["delta"] < 0
+        # Delta should be between -exp(-q*t) and 0 for puts
+        assert -DIVIDEND_DISCOUNT_1Y < greeks["delta"] < 0
 
         # Gamma should be positive (same as call)
         assert greeks["gamma"] > 0
@@ -327,10 +377,16 @@ class TestMertonGreeks:
         assert "dividend_rho" in greeks
         assert greeks["dividend_rho"] > 0
 
-    def test_greeks_dividend_effect(self) -> None:
+    def test_greeks_dividend_effect(
+        self, atm_merton_greeks: dict[str, dict[str, float]], bs_reference: dict[str, Any]
+    ) -> None:
         """Test dividend effect on Greeks."""
         greeks_no_div = merton.greeks(s=100.0, k=100.0, t=1.0, r=0.05, q=0.0, sigma=0.2, is_call=True)
-        greeks_with_div = merton.greeks(s=100.0, k=100.0, t=1.0, r=0.05, q=0.02, sigma=0.2, is_call=True)
+        greeks_with_div = atm_merton_greeks["call"]
+
+        # Greeks reduce to Black-Scholes when q=0
+        for name in ["delta", "gamma", "vega"]:
+            assert abs(greeks_no_div[name] - bs_reference["greeks"][name]) < THEORETICAL_TOLERANCE
 
         # Dividend reduces call delta
         assert greeks_with_div["delta"] < greeks_no_div["delta"]
@@ -381,25 +437,22 @@ class TestMertonImpliedVolatility:
         assert abs(iv - true_sigma) < THEORETICAL_TOLERANCE
 
     @pytest.mark.parametrize("array_type", INPUT_ARRAY_TYPES)
-    def test_implied_volatility_batch(self, array_type: str) -> None:
-        """Test batch implied volatility calculation."""
+    @pytest.mark.parametrize("is_call", [True, False])
+    def test_implied_volatility_batch(self, array_type: str, is_call: bool) -> None:
+        """Test batch implied volatility recovers the pricing volatilities."""
+        spots = create_test_array([100.0, 100.0, 100.0], array_type)
+        strikes = create_test_array([100.0, 110.0, 95.0], array_type)
+        times = create_test_array([1.0, 0.5, 1.5], array_type)
+        rates = create_test_array([0.05, 0.04, 0.05], array_type)
+        divs = create_test_array([0.02, 0.01, 0.03], array_type)
         sigmas = np.array([0.2, 0.25, 0.3])
-        prices_vals = [merton.call_price(s=100.0, k=100.0, t=1.0, r=0.05, q=0.02, sigma=sig) for sig in sigmas]
-        prices = create_test_array(prices_vals, array_type)
 
-        spots = create_test_array([100.0, 100.0, 100.0], array_type)
-        strikes = create_test_array([100.0, 100.0, 100.0], array_type)
-        times = create_test_array([1.0, 1.0, 1.0], array_type)
-        rates = create_test_array([0.05, 0.05, 0.05], array_type)
-        divs = create_test_array([0.02, 0.02, 0.02], array_type)
-        # For batch processing with boolean, use scalar True (will broadcast)
-        ivs = merton.implied_volatility_batch(prices, spots, strikes, times, rates, divs, True)
+        price_batch = merton.call_price_batch if is_call else merton.put_price_batch
+        prices = price_batch(spots, strikes, times, rates, divs, create_test_array(sigmas.tolist(), array_type))
+        ivs = merton.implied_volatility_batch(prices, spots, strikes, times, rates, divs, is_call)
 
         arrow.assert_type(ivs)
-        ivs_list = arrow.to_list(ivs)
-        assert len(ivs_list) == 3
-        for _i, (iv, true_sigma) in enumerate(zip(ivs_list, sigmas, strict=False)):
-            assert abs(iv - true_sigma) < THEORETICAL_TOLERANCE
+        np.testing.assert_allclose(to_numpy_array(ivs), sigmas, atol=THEORETICAL_TOLERANCE)
 
     def test_implied_volatility_invalid_price(self) -> None:
         """Test implied volatility with invalid price."""
@@ -414,29 +467,25 @@ class TestMertonProperties:
         """Test call price increases with spot."""
         spots = np.linspace(80, 120, 10)
         prices = [merton.call_price(s=s, k=100.0, t=1.0, r=0.05, q=0.02, sigma=0.2) for s in spots]
-        for i in range(len(prices) - 1):
-            assert prices[i] < prices[i + 1]
+        assert np.all(np.diff(prices) > 0), f"Call prices not increasing in spot: {prices}"
 
     def test_put_price_monotonicity_spot(self) -> None:
         """Test put price decreases with spot."""
         spots = np.linspace(80, 120, 10)
         prices = [merton.put_price(s=s, k=100.0, t=1.0, r=0.05, q=0.02, sigma=0.2) for s in spots]
-        for i in range(len(prices) - 1):
-            assert prices[i] > prices[i + 1]
+        assert np.all(np.diff(prices) < 0), f"Put prices not decreasing in spot: {prices}"
 
     def test_dividend_effect_on_call(self) -> None:
         """Test dividend reduces call value."""
         divs = np.linspace(0, 0.1, 10)
         prices = [merton.call_price(s=100.0, k=100.0, t=1.0, r=0.05, q=q, sigma=0.2) for q in divs]
-        for i in range(len(prices) - 1):
-            assert prices[i] > prices[i + 1]
+        assert np.all(np.diff(prices) < 0), f"Call prices not decreasing in dividend: {prices}"
 
     def test_dividend_effect_on_put(self) -> None:
         """Test dividend increases put value."""
         divs = np.linspace(0, 0.1, 10)
         prices = [merton.put_price(s=100.0, k=100.0, t=1.0, r=0.05, q=q, sigma=0.2) for q in divs]
-        for i in range(len(prices) - 1):
-            assert prices[i] < prices[i + 1]
+        assert np.all(np.diff(prices) > 0), f"Put prices not increasing in dividend: {prices}"
 
     def test_price_bounds_with_dividend(self) -> None:
         """Test option prices respect arbitrage bounds with dividends."""
@@ -459,15 +508,6 @@ class TestMertonProperties:
 class TestMertonEdgeCases:
     """Test edge cases and boundary conditions for Merton model."""
 
-    def test_zero_dividend_matches_black_scholes(self) -> None:
-        """Test Merton with zero dividend matches Black-Scholes."""
-        merton_call = merton.call_price(s=100.0, k=100.0, t=1.0, r=0.05, q=0.0, sigma=0.2)
-        merton_put = merton.put_price(s=100.0, k=100.0, t=1.0, r=0.05, q=0.0, sigma=0.2)
-
-        # Should match standard Black-Scholes values
-        assert abs(merton_call - 10.45) < 0.5
-        assert abs(merton_put - 5.57) < 0.5
-
     def test_very_high_dividend(self) -> None:
         """Test with very high dividend yield."""
         # High dividend makes calls less valuable
@@ -524,8 +564,8 @@ class TestMertonNumericalStability:
         call = merton.call_price(s=10000.0, k=100.0, t=1.0, r=0.05, q=0.02, sigma=0.2)
         assert math.isfinite(call)
         # Should be close to adjusted intrinsic
-        adj_spot = 10000.0 * math.exp(-0.02)
-        disc_strike = 100.0 * math.exp(-0.05)
+        adj_spot = 10000.0 * DIVIDEND_DISCOUNT_1Y
+        disc_strike = 100.0 * RATE_DISCOUNT_1Y
         assert call > (adj_spot - disc_strike) * 0.9
 
     def test_small_spot_values(self) -> None: